@@ -9,11 +9,10 @@ Supports running the full pipeline or individual stages:
 """
 
 import argparse
-import asyncio
 import logging
-import re
 import sys
 import time
+from typing import Any, Awaitable, Callable
 
 logger = logging.getLogger("internship_pipeline")
 
@@ -27,6 +26,47 @@ def _setup_logging() -> None:
     )
 
 
+async def _run_async(func: Callable[[], Awaitable[Any]]) -> None:
+    """Await an async step, then close shared HTTP clients bound to its loop.
+
+    Args:
+        func: Async callable to execute.
+    """
+    import asyncio
+
+    from scripts.utils.github_utils import aclose
+
+    # Let tasks that finish without suspending (cached or empty sources)
+    # complete inline instead of bouncing through the event loop (3.12+).
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    try:
+        await func()
+    finally:
+        await aclose()
+
+
+def _event_loop_runner() -> Callable[[Any], Any]:
+    """Return the function used to run an async step to completion.
+
+    Prefers ``uvloop.run`` (libuv event loop, faster socket I/O) when uvloop
+    is installed on a non-Windows platform, else ``asyncio.run``.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run
+
+    import asyncio
+
+    return asyncio.run
+
+
 def _run_step(name: str, func: object, is_async: bool = False) -> bool:
     """Execute a single pipeline step with error isolation.
 
@@ -42,7 +82,8 @@ def _run_step(name: str, func: object, is_async: bool = False) -> bool:
     start = time.monotonic()
     try:
         if is_async:
-            asyncio.run(func())
+            # Resolved here so sync-only modes (--readme-only) never load asyncio.
+            _event_loop_runner()(_run_async(func))
         else:
             func()
         elapsed = time.monotonic() - start
@@ -166,6 +207,7 @@ def run_clean() -> None:
     titles don't pass word-boundary intern keyword matching.
     """
     import json
+    import re
     from datetime import datetime, timezone
 
     from scripts.utils.config import PROJECT_ROOT, get_config
@@ -354,8 +396,8 @@ def main(argv: list[str] | None = None) -> None:
     Args:
         argv: Argument list (defaults to sys.argv[1:]).
     """
-    _setup_logging()
     args = parse_args(argv)
+    _setup_logging()
 
     if args.discover_only:
         run_discover_only()
@@ -10,18 +10,28 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Awaitable, Optional
+
+import httpx
 
 from scripts.utils.ats_clients import (
+    DEFAULT_TIMEOUT,
+    USER_AGENT,
     AshbyClient,
     GreenhouseClient,
     LeverClient,
     SmartRecruitersClient,
     WorkdayClient,
 )
-from scripts.utils.config import AppConfig, load_config, PROJECT_ROOT
+from scripts.utils.config import (
+    DEFAULT_MAX_CONCURRENT_FETCHES,
+    AppConfig,
+    load_config,
+    PROJECT_ROOT,
+)
+from scripts.utils.fanout import FETCH_ERRORS, collect_listings
 from scripts.utils.models import RawListing
-from scripts.utils.scraper import GenericScraper, monitor_github_repo
+from scripts.utils.scraper import GenericScraper, monitor_all
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +39,10 @@ DATA_DIR = PROJECT_ROOT / "data"
 
 
 async def gather_ats_results(
-    client: object, boards: list, source_name: str,
+    client: object,
+    boards: list,
+    source_name: str,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_FETCHES,
 ) -> list[RawListing]:
     """Gather listings from an ATS client across multiple boards.
 
@@ -37,135 +50,117 @@ async def gather_ats_results(
         client: An ATS client instance with a fetch_listings method.
         boards: List of board config objects (each must have .company).
         source_name: Human-readable source name for logging.
+        max_concurrent: Upper bound on boards fetched simultaneously.
 
     Returns:
         Combined list of all discovered RawListing objects.
     """
-    tasks = [client.fetch_listings(board) for board in boards]
-    if not tasks:
+    if not boards:
         return []
 
-    results_or_errors = await asyncio.gather(*tasks, return_exceptions=True)
-
-    listings: list[RawListing] = []
-    succeeded = 0
-    failed = 0
-    for i, result in enumerate(results_or_errors):
-        board = boards[i]
-        if isinstance(result, BaseException):
-            logger.error("%s %s failed: %s", source_name, board.company, result)
-            failed += 1
-        else:
-            listings.extend(result)
-            succeeded += 1
-
-    logger.info(
-        "%s: %d/%d boards succeeded, %d listings found",
-        source_name, succeeded, succeeded + failed, len(listings),
+    return await collect_listings(
+        boards, client.fetch_listings, source_name,
+        describe=lambda board: board.company, unit="boards",
+        max_concurrent=max_concurrent,
     )
-    return listings
 
 
-async def _run_greenhouse(config: AppConfig) -> list[RawListing]:
+async def _run_greenhouse(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Fetch listings from all configured Greenhouse boards."""
     return await gather_ats_results(
-        GreenhouseClient(config.filters), config.greenhouse_boards, "Greenhouse",
+        GreenhouseClient(config.filters, http), config.greenhouse_boards, "Greenhouse",
+        config.max_concurrent_fetches,
     )
 
 
-async def _run_lever(config: AppConfig) -> list[RawListing]:
+async def _run_lever(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Fetch listings from all configured Lever boards."""
     return await gather_ats_results(
-        LeverClient(config.filters), config.lever_boards, "Lever",
+        LeverClient(config.filters, http), config.lever_boards, "Lever",
+        config.max_concurrent_fetches,
     )
 
 
-async def _run_ashby(config: AppConfig) -> list[RawListing]:
+async def _run_ashby(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Fetch listings from all configured Ashby boards."""
     return await gather_ats_results(
-        AshbyClient(config.filters), config.ashby_boards, "Ashby",
+        AshbyClient(config.filters, http), config.ashby_boards, "Ashby",
+        config.max_concurrent_fetches,
     )
 
 
-async def _run_workday(config: AppConfig) -> list[RawListing]:
+async def _run_workday(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Fetch listings from all configured Workday boards."""
     return await gather_ats_results(
-        WorkdayClient(config.filters), config.workday_boards, "Workday",
+        WorkdayClient(config.filters, http), config.workday_boards, "Workday",
+        config.max_concurrent_fetches,
     )
 
 
-async def _run_smartrecruiters(config: AppConfig) -> list[RawListing]:
+async def _run_smartrecruiters(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Fetch listings from all configured SmartRecruiters boards."""
     return await gather_ats_results(
-        SmartRecruitersClient(config.filters), config.smartrecruiters_boards, "SmartRecruiters",
+        SmartRecruitersClient(config.filters, http), config.smartrecruiters_boards, "SmartRecruiters",
+        config.max_concurrent_fetches,
     )
 
 
-async def _run_scraping(config: AppConfig) -> list[RawListing]:
+async def _run_scraping(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Scrape all configured career pages."""
     if not config.scrape_sources:
         return []
 
-    scraper = GenericScraper()
-    tasks = [scraper.scrape_career_page(source) for source in config.scrape_sources]
-
-    results_or_errors = await asyncio.gather(*tasks, return_exceptions=True)
-
-    listings: list[RawListing] = []
-    succeeded = 0
-    failed = 0
-    for i, result in enumerate(results_or_errors):
-        source = config.scrape_sources[i]
-        if isinstance(result, BaseException):
-            logger.error("Scrape %s failed: %s", source.company, result)
-            failed += 1
-        else:
-            listings.extend(result)
-            succeeded += 1
+    async with GenericScraper(http) as scraper:
+        return await scraper.scrape_all(
+            config.scrape_sources, config.max_concurrent_fetches
+        )
 
-    logger.info(
-        "Scraping: %d/%d sources succeeded, %d listings found",
-        succeeded,
-        succeeded + failed,
-        len(listings),
-    )
-    return listings
 
-
-async def _run_github_monitors(config: AppConfig) -> list[RawListing]:
+async def _run_github_monitors(
+    config: AppConfig, http: Optional[httpx.AsyncClient] = None
+) -> list[RawListing]:
     """Monitor all configured GitHub repositories for new listings."""
     if not config.github_monitors:
         return []
 
-    tasks = [monitor_github_repo(monitor) for monitor in config.github_monitors]
-    results_or_errors = await asyncio.gather(*tasks, return_exceptions=True)
-
-    listings: list[RawListing] = []
-    succeeded = 0
-    failed = 0
-    for i, result in enumerate(results_or_errors):
-        monitor = config.github_monitors[i]
-        if isinstance(result, BaseException):
-            logger.error(
-                "GitHub monitor %s failed: %s", monitor.repo, result
-            )
-            failed += 1
-        else:
-            listings.extend(result)
-            succeeded += 1
+    return await monitor_all(
+        config.github_monitors, http, config.max_concurrent_fetches
+    )
 
-    logger.info(
-        "GitHub monitors: %d/%d succeeded, %d listings found",
-        succeeded,
-        succeeded + failed,
-        len(listings),
+
+def _build_shared_client() -> httpx.AsyncClient:
+    """Create the HTTP/2 client shared by every source category in one run.
+
+    Sharing one pool lets boards hosted on the same ATS domain reuse
+    connections instead of each client paying its own DNS + TLS setup.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=DEFAULT_TIMEOUT,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=30),
     )
-    return listings
 
 
 def _save_raw_results(listings: list[RawListing]) -> Path:
     """Save raw discovery results to a timestamped JSON file.
 
+    Each listing is encoded straight to JSON bytes by pydantic's compiled
+    serializer and written one per line, without building intermediate dicts.
+
     Args:
         listings: All discovered RawListing objects.
 
@@ -173,24 +168,22 @@ def _save_raw_results(listings: list[RawListing]) -> Path:
         Path to the saved JSON file.
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    output_path = DATA_DIR / f"raw_discovery_{timestamp}.json"
-
-    serialized: list[dict[str, Any]] = []
-    for listing in listings:
-        data = listing.model_dump(mode="json")
-        serialized.append(data)
-
-    payload = {
-        "discovered_at": datetime.now(timezone.utc).isoformat(),
-        "total_count": len(serialized),
-        "listings": serialized,
-    }
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, default=str)
-
-    logger.info("Saved %d raw listings to %s", len(serialized), output_path)
+    now = datetime.now(timezone.utc)
+    output_path = DATA_DIR / f"raw_discovery_{now:%Y%m%dT%H%M%SZ}.json"
+    discovered_at = now.isoformat()
+
+    with open(output_path, "wb") as f:
+        f.write(
+            b'{"discovered_at": %s, "total_count": %d, "listings": ['
+            % (json.dumps(discovered_at).encode("utf-8"), len(listings))
+        )
+        to_json = RawListing.__pydantic_serializer__.to_json
+        for i, listing in enumerate(listings):
+            f.write(b",\n" if i else b"\n")
+            f.write(to_json(listing))
+        f.write(b"\n]}\n" if listings else b"]}\n")
+
+    logger.info("Saved %d raw listings to %s", len(listings), output_path)
     return output_path
 
 
@@ -210,36 +203,39 @@ async def discover_all() -> list[RawListing]:
         config.total_sources,
     )
 
-    # Run all source categories in parallel
-    source_tasks = [
-        _run_greenhouse(config),
-        _run_lever(config),
-        _run_ashby(config),
-        _run_workday(config),
-        _run_smartrecruiters(config),
-        _run_scraping(config),
-        _run_github_monitors(config),
-    ]
-
-    results = await asyncio.gather(*source_tasks, return_exceptions=True)
-
-    # Collect all listings, isolating any top-level failures
-    all_listings: list[RawListing] = []
-    source_names = [
-        "Greenhouse", "Lever", "Ashby", "Workday",
-        "SmartRecruiters", "Scraping", "GitHub Monitors",
-    ]
-
-    sources_succeeded = 0
+    results: dict[str, list[RawListing]] = {}
     sources_failed = 0
 
-    for name, result in zip(source_names, results):
-        if isinstance(result, BaseException):
-            logger.error("Source category %s failed entirely: %s", name, result)
+    async def _collect(name: str, source: Awaitable[list[RawListing]]) -> None:
+        """Await one source category and record its listings as soon as it finishes."""
+        nonlocal sources_failed
+        try:
+            results[name] = await source
+        except FETCH_ERRORS as exc:
+            logger.error("Source category %s failed entirely: %s", name, exc)
             sources_failed += 1
-        else:
-            all_listings.extend(result)
-            sources_succeeded += 1
+
+    # Run all source categories in parallel over one shared connection pool,
+    # collecting each as it completes. The client closes once all finish.
+    async with _build_shared_client() as http:
+        sources: dict[str, Awaitable[list[RawListing]]] = {
+            "Greenhouse": _run_greenhouse(config, http),
+            "Lever": _run_lever(config, http),
+            "Ashby": _run_ashby(config, http),
+            "Workday": _run_workday(config, http),
+            "SmartRecruiters": _run_smartrecruiters(config, http),
+            "Scraping": _run_scraping(config, http),
+            "GitHub Monitors": _run_github_monitors(config, http),
+        }
+        async with asyncio.TaskGroup() as tg:
+            for name, source in sources.items():
+                tg.create_task(_collect(name, source))
+
+    # Combine in category order so the raw output is stable between runs
+    all_listings = [
+        listing for name in sources if name in results for listing in results[name]
+    ]
+    sources_succeeded = len(results)
 
     logger.info(
         "Discovery complete: %d total listings from %d/%d source categories",
@@ -248,9 +244,10 @@ async def discover_all() -> list[RawListing]:
         sources_succeeded + sources_failed,
     )
 
-    # Save raw results for debugging and downstream processing
+    # Save raw results for debugging and downstream processing. The write is
+    # blocking file I/O, so run it off the event loop thread.
     if all_listings:
-        _save_raw_results(all_listings)
+        await asyncio.to_thread(_save_raw_results, all_listings)
     else:
         logger.warning("No listings discovered from any source")
 
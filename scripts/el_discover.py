@@ -9,7 +9,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable
 
 from scripts.discover import gather_ats_results
 from scripts.utils.ats_clients import (
@@ -21,7 +21,7 @@ from scripts.utils.ats_clients import (
 )
 from scripts.utils.config import AppConfig, load_config, PROJECT_ROOT
 from scripts.utils.models import RawListing
-from scripts.utils.scraper import GenericScraper, monitor_github_repo
+from scripts.utils.scraper import GenericScraper, monitor_all
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,7 @@ async def _run_greenhouse(config: AppConfig, filters: object) -> list[RawListing
     """Fetch entry-level listings from all configured Greenhouse boards."""
     return await gather_ats_results(
         GreenhouseClient(filters), config.greenhouse_boards, "Greenhouse (entry-level)",
+        config.max_concurrent_fetches,
     )
 
 
@@ -52,6 +53,7 @@ async def _run_lever(config: AppConfig, filters: object) -> list[RawListing]:
     """Fetch entry-level listings from all configured Lever boards."""
     return await gather_ats_results(
         LeverClient(filters), config.lever_boards, "Lever (entry-level)",
+        config.max_concurrent_fetches,
     )
 
 
@@ -59,6 +61,7 @@ async def _run_ashby(config: AppConfig, filters: object) -> list[RawListing]:
     """Fetch entry-level listings from all configured Ashby boards."""
     return await gather_ats_results(
         AshbyClient(filters), config.ashby_boards, "Ashby (entry-level)",
+        config.max_concurrent_fetches,
     )
 
 
@@ -66,6 +69,7 @@ async def _run_workday(config: AppConfig, filters: object) -> list[RawListing]:
     """Fetch entry-level listings from all configured Workday boards."""
     return await gather_ats_results(
         WorkdayClient(filters), config.workday_boards, "Workday (entry-level)",
+        config.max_concurrent_fetches,
     )
 
 
@@ -73,6 +77,7 @@ async def _run_smartrecruiters(config: AppConfig, filters: object) -> list[RawLi
     """Fetch entry-level listings from all configured SmartRecruiters boards."""
     return await gather_ats_results(
         SmartRecruitersClient(filters), config.smartrecruiters_boards, "SmartRecruiters (entry-level)",
+        config.max_concurrent_fetches,
     )
 
 
@@ -81,28 +86,10 @@ async def _run_scraping(config: AppConfig) -> list[RawListing]:
     if not config.scrape_sources:
         return []
 
-    scraper = GenericScraper()
-    tasks = [scraper.scrape_career_page(source) for source in config.scrape_sources]
-
-    results_or_errors = await asyncio.gather(*tasks, return_exceptions=True)
-
-    listings: list[RawListing] = []
-    succeeded = 0
-    failed = 0
-    for i, result in enumerate(results_or_errors):
-        source = config.scrape_sources[i]
-        if isinstance(result, BaseException):
-            logger.error("Scrape %s failed: %s", source.company, result)
-            failed += 1
-        else:
-            listings.extend(result)
-            succeeded += 1
-
-    logger.info(
-        "Scraping (entry-level): %d/%d sources succeeded, %d listings found",
-        succeeded, succeeded + failed, len(listings),
-    )
-    return listings
+    async with GenericScraper() as scraper:
+        return await scraper.scrape_all(
+            config.scrape_sources, config.max_concurrent_fetches
+        )
 
 
 async def _run_github_monitors(config: AppConfig) -> list[RawListing]:
@@ -110,33 +97,16 @@ async def _run_github_monitors(config: AppConfig) -> list[RawListing]:
     if not config.github_monitors:
         return []
 
-    tasks = [monitor_github_repo(monitor) for monitor in config.github_monitors]
-    results_or_errors = await asyncio.gather(*tasks, return_exceptions=True)
-
-    listings: list[RawListing] = []
-    succeeded = 0
-    failed = 0
-    for i, result in enumerate(results_or_errors):
-        monitor = config.github_monitors[i]
-        if isinstance(result, BaseException):
-            logger.error("GitHub monitor %s failed: %s", monitor.repo, result)
-            failed += 1
-        else:
-            listings.extend(result)
-            succeeded += 1
-
-    logger.info(
-        "GitHub monitors (entry-level): %d/%d succeeded, %d listings found",
-        succeeded, succeeded + failed, len(listings),
+    return await monitor_all(
+        config.github_monitors, concurrency=config.max_concurrent_fetches
     )
-    return listings
 
 
 def _save_raw_results(listings: list[RawListing]) -> Path:
     """Save raw entry-level discovery results to a timestamped JSON file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    output_path = DATA_DIR / f"raw_el_discovery_{timestamp}.json"
+    now = datetime.now(timezone.utc)
+    output_path = DATA_DIR / f"raw_el_discovery_{now:%Y%m%dT%H%M%SZ}.json"
 
     serialized: list[dict[str, Any]] = []
     for listing in listings:
@@ -144,7 +114,7 @@ def _save_raw_results(listings: list[RawListing]) -> Path:
         serialized.append(data)
 
     payload = {
-        "discovered_at": datetime.now(timezone.utc).isoformat(),
+        "discovered_at": now.isoformat(),
         "total_count": len(serialized),
         "listings": serialized,
     }
@@ -173,28 +143,23 @@ async def discover_entry_level() -> list[RawListing]:
         config.total_sources,
     )
 
-    source_tasks = [
-        _run_greenhouse(config, filters),
-        _run_lever(config, filters),
-        _run_ashby(config, filters),
-        _run_workday(config, filters),
-        _run_smartrecruiters(config, filters),
-        _run_scraping(config),
-        _run_github_monitors(config),
-    ]
+    sources: dict[str, Awaitable[list[RawListing]]] = {
+        "Greenhouse": _run_greenhouse(config, filters),
+        "Lever": _run_lever(config, filters),
+        "Ashby": _run_ashby(config, filters),
+        "Workday": _run_workday(config, filters),
+        "SmartRecruiters": _run_smartrecruiters(config, filters),
+        "Scraping": _run_scraping(config),
+        "GitHub Monitors": _run_github_monitors(config),
+    }
 
-    results = await asyncio.gather(*source_tasks, return_exceptions=True)
+    results = await asyncio.gather(*sources.values(), return_exceptions=True)
 
     all_listings: list[RawListing] = []
-    source_names = [
-        "Greenhouse", "Lever", "Ashby", "Workday",
-        "SmartRecruiters", "Scraping", "GitHub Monitors",
-    ]
-
     sources_succeeded = 0
     sources_failed = 0
 
-    for name, result in zip(source_names, results):
+    for name, result in zip(sources, results):
         if isinstance(result, BaseException):
             logger.error("Source category %s failed entirely: %s", name, result)
             sources_failed += 1
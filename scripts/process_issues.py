@@ -12,7 +12,12 @@ from datetime import date, datetime, timezone
 from typing import Optional
 
 from scripts.utils.config import PROJECT_ROOT, get_config, get_secret
-from scripts.utils.github_utils import close_issue, comment_on_issue, fetch_issues
+from scripts.utils.github_utils import (
+    aclose,
+    close_issue,
+    comment_on_issue,
+    fetch_issues,
+)
 from scripts.utils.models import (
     JobListing,
     JobsDatabase,
@@ -445,6 +450,14 @@ async def process_issues() -> int:
     return accepted
 
 
+async def _main() -> int:
+    """Process issues, then close the shared GitHub client."""
+    try:
+        return await process_issues()
+    finally:
+        await aclose()
+
+
 if __name__ == "__main__":
     import asyncio
 
@@ -452,5 +465,5 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
     )
-    count = asyncio.run(process_issues())
+    count = asyncio.run(_main())
     logger.info("Processed %d issues", count)
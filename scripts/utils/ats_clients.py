@@ -5,11 +5,14 @@ for retry with exponential backoff. All clients return list[RawListing].
 """
 
 import asyncio
+import functools
 import logging
 import re
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from html.parser import HTMLParser
+from typing import AsyncIterator, Optional
 
 import httpx
 from tenacity import (
@@ -63,11 +66,13 @@ def _html_to_text(html: str) -> str:
         return ""
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=4096)
 def _slugify(name: str) -> str:
-    """Convert a company name to a kebab-case slug."""
-    slug = name.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    return slug.strip("-")
+    """Convert a company name to a kebab-case slug, cached per name."""
+    return _SLUG_RE.sub("-", name.lower()).strip("-")
 
 
 def _title_matches_include(title: str, keywords: list[str]) -> bool:
@@ -92,8 +97,12 @@ class BaseATSClient(ABC):
     _semaphores: dict[str, asyncio.Semaphore] = {}
     _domain: str = ""
 
-    def __init__(self, filters: FiltersConfig) -> None:
+    def __init__(
+        self, filters: FiltersConfig, http: Optional[httpx.AsyncClient] = None
+    ) -> None:
         self.filters = filters
+        # Shared client owned by the caller; None means one client per fetch.
+        self._http = http
         self._include_keywords = [
             kw.lower() for kw in filters.keywords_include
         ]
@@ -115,6 +124,15 @@ class BaseATSClient(ABC):
             follow_redirects=True,
         )
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the injected shared client, or a short-lived one closed on exit."""
+        if self._http is not None:
+            yield self._http
+            return
+        async with self._build_client() as client:
+            yield client
+
     def _should_include(self, title: str) -> bool:
         """Check if a job title passes include/exclude keyword filters."""
         if not _title_matches_include(title, self._include_keywords):
@@ -166,7 +184,7 @@ class GreenhouseClient(BaseATSClient):
         url = f"https://boards-api.greenhouse.io/v1/boards/{board.token}/jobs?content=true"
         results: list[RawListing] = []
 
-        async with self._build_client() as client:
+        async with self._client() as client:
             try:
                 response = await self._request(client, url)
             except httpx.HTTPStatusError as exc:
@@ -266,7 +284,7 @@ class LeverClient(BaseATSClient):
         url = f"https://api.lever.co/v0/postings/{board.company_slug}"
         results: list[RawListing] = []
 
-        async with self._build_client() as client:
+        async with self._client() as client:
             try:
                 response = await self._request(client, url)
             except httpx.HTTPStatusError as exc:
@@ -406,7 +424,7 @@ query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
 
         results: list[RawListing] = []
 
-        async with self._build_client() as client:
+        async with self._client() as client:
             try:
                 response = await self._request(client, payload)
             except httpx.HTTPStatusError as exc:
@@ -528,7 +546,7 @@ class WorkdayClient(BaseATSClient):
         offset = 0
         total = None
 
-        async with self._build_client() as client:
+        async with self._client() as client:
             while True:
                 payload = {
                     "limit": limit,
@@ -648,7 +666,7 @@ class SmartRecruitersClient(BaseATSClient):
         offset = 0
         total = None
 
-        async with self._build_client() as client:
+        async with self._client() as client:
             while True:
                 params = {
                     "q": "intern",
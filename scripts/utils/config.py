@@ -4,6 +4,7 @@ Loads config.yaml from the project root and provides typed access to all
 configuration sections via Pydantic models. Also loads .env for secrets.
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -11,7 +12,12 @@ from typing import Optional
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 CONFIG_PATH = PROJECT_ROOT / "config.yaml"
 ENV_PATH = PROJECT_ROOT / ".env"
 
+# Default cap on simultaneous board/page fetches per discovery source.
+DEFAULT_MAX_CONCURRENT_FETCHES = 16
+
+# Section models build their validators on first use rather than at import;
+# most entry points only ever touch a few of them directly.
+_SECTION_MODEL_CONFIG = ConfigDict(defer_build=True)
+
 
 # ---------------------------------------------------------------------------
 # Config section models
@@ -27,6 +40,8 @@ ENV_PATH = PROJECT_ROOT / ".env"
 
 class ProjectConfig(BaseModel):
     """Top-level project metadata."""
+    model_config = _SECTION_MODEL_CONFIG
+
     name: str
     season: str
     github_repo: str
@@ -35,6 +50,8 @@ class ProjectConfig(BaseModel):
 
 class GeorgiaFocusConfig(BaseModel):
     """Georgia-specific location prioritization settings."""
+    model_config = _SECTION_MODEL_CONFIG
+
     priority_locations: list[str] = []
     highlight_georgia: bool = True
     georgia_section_in_readme: bool = True
@@ -42,6 +59,8 @@ class GeorgiaFocusConfig(BaseModel):
 
 class GreenhouseBoard(BaseModel):
     """A single Greenhouse ATS board source."""
+    model_config = _SECTION_MODEL_CONFIG
+
     token: str
     company: str
     is_faang_plus: bool = False
@@ -49,6 +68,8 @@ class GreenhouseBoard(BaseModel):
 
 class LeverBoard(BaseModel):
     """A single Lever ATS board source."""
+    model_config = _SECTION_MODEL_CONFIG
+
     company_slug: str
     company: str
     is_faang_plus: bool = False
@@ -56,6 +77,8 @@ class LeverBoard(BaseModel):
 
 class AshbyBoard(BaseModel):
     """A single Ashby ATS board source."""
+    model_config = _SECTION_MODEL_CONFIG
+
     company_slug: str
     company: str
     is_faang_plus: bool = False
@@ -63,6 +86,8 @@ class AshbyBoard(BaseModel):
 
 class WorkdayBoard(BaseModel):
     """A Workday career site source."""
+    model_config = _SECTION_MODEL_CONFIG
+
     company: str
     company_code: str  # subdomain e.g. "ibm"
     instance: int = 1  # wd1, wd2, etc.
@@ -72,6 +97,8 @@ class WorkdayBoard(BaseModel):
 
 class SmartRecruitersBoard(BaseModel):
     """A SmartRecruiters career site source."""
+    model_config = _SECTION_MODEL_CONFIG
+
     company: str
     company_id: str  # identifier for API, e.g. "VISA"
     is_faang_plus: bool = False
@@ -79,6 +106,8 @@ class SmartRecruitersBoard(BaseModel):
 
 class ScrapeSource(BaseModel):
     """A career page that requires web scraping."""
+    model_config = _SECTION_MODEL_CONFIG
+
     company: str
     url: str
     is_faang_plus: bool = False
@@ -86,6 +115,8 @@ class ScrapeSource(BaseModel):
 
 class GitHubMonitor(BaseModel):
     """A GitHub repo to monitor for new listings."""
+    model_config = _SECTION_MODEL_CONFIG
+
     repo: str
     branch: str = "main"
     file: str = "README.md"
@@ -93,6 +124,8 @@ class GitHubMonitor(BaseModel):
 
 class FiltersConfig(BaseModel):
     """Keyword and company filtering rules."""
+    model_config = _SECTION_MODEL_CONFIG
+
     keywords_include: list[str] = []
     keywords_exclude: list[str] = []
     role_categories: dict[str, list[str]] = {}
@@ -101,12 +134,16 @@ class FiltersConfig(BaseModel):
 
 class EntryLevelFiltersConfig(BaseModel):
     """Keyword filtering rules for entry-level job discovery."""
+    model_config = _SECTION_MODEL_CONFIG
+
     keywords_include: list[str] = []
     keywords_exclude: list[str] = []
 
 
 class AIConfig(BaseModel):
     """AI enrichment settings."""
+    model_config = _SECTION_MODEL_CONFIG
+
     model: str = "gemini-2.0-flash"
     max_tokens: int = 1024
     enrichment_prompt: str = ""
@@ -115,6 +152,8 @@ class AIConfig(BaseModel):
 
 class ScheduleConfig(BaseModel):
     """Cron schedule settings."""
+    model_config = _SECTION_MODEL_CONFIG
+
     update_interval_hours: int = 6
     link_check_interval_hours: int = 24
     archive_after_days: int = 7
@@ -141,6 +180,7 @@ class AppConfig(BaseModel):
     ai: AIConfig = Field(default_factory=AIConfig)
     schedule: ScheduleConfig = Field(default_factory=ScheduleConfig)
     company_industries: dict[str, str] = {}
+    max_concurrent_fetches: int = Field(default=DEFAULT_MAX_CONCURRENT_FETCHES, ge=1)
 
     @property
     def total_sources(self) -> int:
@@ -180,17 +220,24 @@ def is_big_tech(company_name: str, config: Optional["AppConfig"] = None) -> bool
 
 _config: Optional[AppConfig] = None
 
+# Built once so every load reuses the same validator
+_APP_CONFIG_ADAPTER = TypeAdapter(AppConfig)
+
 
 def load_config(config_path: Optional[Path] = None) -> AppConfig:
     """Load and validate configuration from a YAML file.
 
-    Also loads environment variables from .env if the file exists.
+    Also loads environment variables from .env if the file exists. Parsed
+    configs are cached per resolved path, modification time and size, so
+    loading an unchanged file again returns the same AppConfig instance.
+    That instance is shared by every caller and must be treated as
+    read-only; use ``model_copy(deep=True)`` to get one that can be changed.
 
     Args:
         config_path: Path to config.yaml. Defaults to PROJECT_ROOT/config.yaml.
 
     Returns:
-        A validated AppConfig instance.
+        A validated AppConfig instance, shared with other callers.
 
     Raises:
         FileNotFoundError: If the config file does not exist.
@@ -206,28 +253,39 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
         load_dotenv(ENV_PATH)
         logger.debug("Loaded environment variables from %s", ENV_PATH)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+
+    # Size catches same-tick rewrites on filesystems with coarse mtimes
+    _config = _load_config_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return _config
 
+
+@functools.lru_cache(maxsize=32)
+def _load_config_file(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse and validate a config file; ``mtime_ns`` and ``size`` only key the cache."""
+    path = Path(path_str)
     with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_YamlLoader)
 
     if raw is None:
         raise ValueError(f"Config file is empty: {path}")
 
-    _config = AppConfig.model_validate(raw)
+    config = _APP_CONFIG_ADAPTER.validate_python(raw)
     logger.info(
         "Config loaded: %d total sources (%d greenhouse, %d lever, %d ashby, %d workday, %d smartrecruiters, %d scrape, %d monitors)",
-        _config.total_sources,
-        len(_config.greenhouse_boards),
-        len(_config.lever_boards),
-        len(_config.ashby_boards),
-        len(_config.workday_boards),
-        len(_config.smartrecruiters_boards),
-        len(_config.scrape_sources),
-        len(_config.github_monitors),
+        config.total_sources,
+        len(config.greenhouse_boards),
+        len(config.lever_boards),
+        len(config.ashby_boards),
+        len(config.workday_boards),
+        len(config.smartrecruiters_boards),
+        len(config.scrape_sources),
+        len(config.github_monitors),
     )
-    return _config
+    return config
 
 
 def get_config() -> AppConfig:
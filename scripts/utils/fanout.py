@@ -0,0 +1,108 @@
+"""Bounded concurrent fan-out over discovery sources.
+
+Provides the helpers every discovery category uses to fetch many boards,
+career pages, or monitored repos at once: iter_completed() streams results
+as they finish, and collect_listings() folds them into one list in source
+order while logging per-item failures and an "N/M succeeded" summary.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+from pydantic import ValidationError
+
+from scripts.utils.config import DEFAULT_MAX_CONCURRENT_FETCHES
+from scripts.utils.models import RawListing
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean one source is unreachable or returned bad data. Anything
+# else is a bug in the fetcher and propagates instead of being logged away.
+FETCH_ERRORS: tuple[type[Exception], ...] = (
+    httpx.HTTPError,
+    OSError,
+    ValidationError,
+    ValueError,
+)
+
+
+async def iter_completed(
+    items: list,
+    fetch: Callable[[Any], Awaitable[list[RawListing]]],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+) -> AsyncIterator[tuple[Any, list[RawListing] | BaseException]]:
+    """Run ``fetch(item)`` for every item and yield results as they finish.
+
+    Unlike ``asyncio.gather``, a slow item never holds back results that are
+    already available. At most ``max_concurrent`` fetches are in flight at
+    once; a new one starts as soon as a previous one finishes.
+
+    Args:
+        items: Source config objects (boards, scrape sources, monitors).
+        fetch: Coroutine function returning listings for one item.
+        max_concurrent: Upper bound on simultaneous fetches.
+
+    Yields:
+        ``(item, result)`` tuples in completion order, where ``result`` is
+        either the fetched listings or the ``FETCH_ERRORS`` exception that
+        was raised. Any other exception propagates.
+    """
+    sem = asyncio.Semaphore(max_concurrent)
+
+    async def _run(item: Any) -> tuple[Any, list[RawListing] | BaseException]:
+        async with sem:
+            try:
+                return item, await fetch(item)
+            except FETCH_ERRORS as exc:
+                return item, exc
+
+    for fut in asyncio.as_completed([_run(item) for item in items]):
+        yield await fut
+
+
+async def collect_listings(
+    items: list,
+    fetch: Callable[[Any], Awaitable[list[RawListing]]],
+    label: str,
+    describe: Callable[[Any], str],
+    unit: str = "sources",
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+) -> list[RawListing]:
+    """Fetch listings for every item and combine the successful results.
+
+    Results are gathered as they complete but returned in the order of
+    ``items``, so the same input always yields the same output order.
+
+    Args:
+        items: Source config objects (boards, scrape sources, monitors).
+        fetch: Coroutine function returning listings for one item.
+        label: Category name used in log messages, e.g. "Greenhouse".
+        describe: Returns the name logged for a failed item.
+        unit: Plural noun for the items in the summary line.
+        max_concurrent: Upper bound on simultaneous fetches.
+
+    Returns:
+        Combined list of RawListing objects from every item that succeeded.
+    """
+    by_index: list[Optional[list[RawListing]]] = [None] * len(items)
+    succeeded = 0
+    failed = 0
+    async for index, result in iter_completed(
+        list(range(len(items))), lambda i: fetch(items[i]), max_concurrent,
+    ):
+        if isinstance(result, BaseException):
+            logger.error("%s %s failed: %s", label, describe(items[index]), result)
+            failed += 1
+        else:
+            by_index[index] = result
+            succeeded += 1
+
+    listings = [listing for result in by_index if result for listing in result]
+
+    logger.info(
+        "%s: %d/%d %s succeeded, %d listings found",
+        label, succeeded, succeeded + failed, unit, len(listings),
+    )
+    return listings
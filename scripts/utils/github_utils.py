@@ -7,18 +7,59 @@ Provides async functions for interacting with the GitHub API:
 - Reading file content from a repository
 """
 
-import base64
+import asyncio
+import functools
+import json
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+
+from scripts.utils import http_cache
 from scripts.utils.config import get_secret
 
 logger = logging.getLogger(__name__)
 
 GITHUB_API_BASE = "https://api.github.com"
 DEFAULT_TIMEOUT = 15.0
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
+# Statuses worth retrying: secondary rate limits and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+
+# Shared client so every call reuses one HTTP/2 connection to api.github.com
+# instead of paying a fresh TCP + TLS handshake per request. All traffic goes
+# to a single host, so a tiny pool is enough: concurrent requests multiplex
+# as streams over the same socket.
+_client: Optional[httpx.AsyncClient] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _headers_for_token(token: Optional[str]) -> dict[str, str]:
+    """Build (and memoize) the GitHub API headers for a resolved token.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    headers = {
+        "Accept": "application/vnd.github+v3+json",
+        "User-Agent": "InternshipTracker/1.0",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
 
 
 def _build_headers(token: Optional[str] = None) -> dict[str, str]:
@@ -29,23 +70,229 @@ def _build_headers(token: Optional[str] = None) -> dict[str, str]:
 
     Returns:
         Dict of HTTP headers including Accept and optionally Authorization.
+        The dict is cached per token and must not be mutated.
     """
-    headers = {
-        "Accept": "application/vnd.github+v3+json",
-        "User-Agent": "InternshipTracker/1.0",
-    }
     resolved_token = token or get_secret("GITHUB_TOKEN")
-    if resolved_token:
-        headers["Authorization"] = f"Bearer {resolved_token}"
-    else:
+    if not resolved_token:
         logger.warning("No GITHUB_TOKEN available — requests may be rate-limited")
-    return headers
+    return _headers_for_token(resolved_token or None)
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _conditional_headers(
+    headers: Optional[dict[str, str]], cached: Optional[tuple[str, str]],
+) -> Optional[dict[str, str]]:
+    """Add ``If-None-Match`` for a cached ETag without mutating ``headers``."""
+    if cached is None:
+        return headers
+    return {**(headers or {}), "If-None-Match": cached[0]}
+
+
+async def _cache_lookup(
+    path: str,
+    params: dict[str, Any],
+    headers: Optional[dict[str, str]],
+    http: Optional[httpx.AsyncClient],
+) -> tuple[str, Optional[tuple[str, str]]]:
+    """Build the ETag cache key for a GET and read its cached entry.
+
+    The key covers the headers the request is actually sent with: the
+    client's defaults with ``headers`` merged over them.
+
+    Args:
+        path: API path relative to GITHUB_API_BASE.
+        params: Query parameters.
+        headers: Per-request headers.
+        http: Client the request will be sent on; the shared one if omitted.
+
+    Returns:
+        Tuple of (cache key, cached (etag, body) or None).
+    """
+    client = http if http is not None else await _get_client()
+    sent = httpx.Headers(client.headers)
+    sent.update(headers or {})
+    url = str(httpx.URL(GITHUB_API_BASE + path, params=params))
+    cache_key = http_cache.cache_key(url, sent)
+    return cache_key, await asyncio.to_thread(http_cache.get, cache_key)
+
+
+async def _cached_body(
+    response: httpx.Response, cache_key: str, cached: Optional[tuple[str, str]],
+) -> Optional[str]:
+    """Return the body of a 200 or 304 response, refreshing the ETag cache.
+
+    Args:
+        response: Response to a (possibly conditional) GET.
+        cache_key: Key the request's ETag is cached under.
+        cached: The (etag, body) pair sent with the request, if any.
+
+    Returns:
+        The response body (from cache on 304), or None for any other status.
+    """
+    if response.status_code == 304 and cached is not None:
+        logger.debug("Not modified, using cached body for %s", cache_key)
+        return cached[1]
+    if response.status_code != 200:
+        return None
+    etag = response.headers.get("ETag")
+    if etag:
+        await asyncio.to_thread(http_cache.put, cache_key, etag, response.text)
+    return response.text
+
+
+async def _cached_json(
+    response: httpx.Response, cache_key: str, cached: Optional[tuple[str, str]],
+) -> Any:
+    """Decode a 200 or 304 JSON response via ``_cached_body``.
+
+    Returns:
+        The decoded JSON body, or None for any other status.
+    """
+    body = await _cached_body(response, cache_key, cached)
+    if body is None:
+        return None
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared GitHub API client, creating it on first use.
+
+    Returns:
+        An HTTP/2 httpx.AsyncClient bound to GITHUB_API_BASE.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_BASE,
+            headers=_build_headers(),
+            timeout=DEFAULT_TIMEOUT,
+            default_encoding="utf-8",
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=1, max_connections=4),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared GitHub API client, if one was created.
+
+    Must be awaited before the event loop that created the client exits.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class _RetryableResponse(Exception):
+    """Raised for a 429/5xx response so tenacity retries the request."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+_backoff = wait_exponential(multiplier=1, min=1, max=10)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait for the server's ``Retry-After`` if given, else back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, _RetryableResponse):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+    return _backoff(retry_state)
+
+
+@retry(
+    retry=retry_if_exception_type(_RetryableResponse),
+    stop=stop_after_attempt(3),
+    wait=_retry_wait,
+    reraise=True,
+)
+async def _send(
+    method: str, path: str, http: Optional[httpx.AsyncClient] = None, **kwargs: Any,
+) -> httpx.Response:
+    """Send one request on ``http`` or the shared client, raising on retryable statuses."""
+    client = http if http is not None else await _get_client()
+    response = await getattr(client, method.lower())(path, **kwargs)
+    logger.info(
+        "%s %s — %s %d",
+        method,
+        path,
+        response.http_version,
+        response.status_code,
+    )
+    if response.status_code in RETRY_STATUSES:
+        raise _RetryableResponse(response)
+    return response
+
+
+async def _gh_request(
+    method: str,
+    path: str,
+    *,
+    action: str,
+    headers: Optional[dict[str, str]] = None,
+    params: Optional[dict[str, Any]] = None,
+    json: Optional[dict[str, Any]] = None,
+    expect: tuple[int, ...] = (200,),
+    http: Optional[httpx.AsyncClient] = None,
+) -> Optional[httpx.Response]:
+    """Send a GitHub API request with retries and uniform error logging.
+
+    Responses with a 429 or 5xx status are retried up to three attempts,
+    honoring ``Retry-After`` when the server sends one.
+
+    Args:
+        method: HTTP method, e.g. "GET".
+        path: API path relative to GITHUB_API_BASE.
+        action: What the request does, for log messages
+            (e.g. "fetching issues from owner/name").
+        headers: Per-request headers merged over the client defaults.
+        params: Query parameters.
+        json: JSON request body.
+        expect: Status codes that count as success.
+        http: Client to send on instead of the shared one.
+
+    Returns:
+        The response if its status is in ``expect``, otherwise None.
+    """
+    kwargs: dict[str, Any] = {"headers": headers}
+    if params is not None:
+        kwargs["params"] = params
+    if json is not None:
+        kwargs["json"] = json
+
+    try:
+        response = await _send(method, path, http, **kwargs)
+    except _RetryableResponse as exc:
+        response = exc.response
+    except httpx.HTTPError as exc:
+        logger.error("HTTP error %s: %s", action, exc)
+        return None
+    except Exception as exc:
+        logger.error("Unexpected error %s: %s", action, exc)
+        return None
+
+    if response.status_code in expect:
+        return response
+    logger.error("Failed %s: HTTP %d", action, response.status_code)
+    return None
 
 
 async def fetch_issues(
     repo: str,
     label: str = "new-internship",
     token: Optional[str] = None,
+    http: Optional[httpx.AsyncClient] = None,
 ) -> list[dict]:
     """Fetch open issues with the given label from a GitHub repo.
 
@@ -53,36 +300,32 @@ async def fetch_issues(
         repo: Repository in 'owner/name' format.
         label: Issue label to filter by.
         token: Optional GitHub token. Falls back to GITHUB_TOKEN env var.
+        http: Optional client bound to GITHUB_API_BASE; the shared client
+            is used if omitted.
 
     Returns:
         List of issue dicts from the GitHub API, or empty list on error.
     """
-    url = f"{GITHUB_API_BASE}/repos/{repo}/issues"
+    url = f"/repos/{repo}/issues"
     params = {"labels": label, "state": "open", "per_page": 100}
-    headers = _build_headers(token)
+    headers = _build_headers(token) if token else None
+    cache_key, cached = await _cache_lookup(url, params, headers, http)
 
-    try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url, headers=headers, params=params)
-            logger.info(
-                "GET %s — status %d (%d issues)",
-                url,
-                response.status_code,
-                len(response.json()) if response.status_code == 200 else 0,
-            )
-            if response.status_code == 200:
-                return response.json()
-            logger.error(
-                "Failed to fetch issues from %s: HTTP %d",
-                repo,
-                response.status_code,
-            )
-            return []
-    except httpx.HTTPError as exc:
-        logger.error("HTTP error fetching issues from %s: %s", repo, exc)
+    response = await _gh_request(
+        "GET",
+        url,
+        action=f"fetching issues from {repo}",
+        headers=_conditional_headers(headers, cached),
+        params=params,
+        expect=(200, 304),
+        http=http,
+    )
+    if response is None:
         return []
+    try:
+        return await _cached_json(response, cache_key, cached) or []
     except Exception as exc:
-        logger.error("Unexpected error fetching issues from %s: %s", repo, exc)
+        logger.error("Unexpected error decoding issues from %s: %s", repo, exc)
         return []
 
 
@@ -91,6 +334,7 @@ async def comment_on_issue(
     issue_number: int,
     body: str,
     token: Optional[str] = None,
+    http: Optional[httpx.AsyncClient] = None,
 ) -> bool:
     """Post a comment on a GitHub issue.
 
@@ -99,47 +343,29 @@ async def comment_on_issue(
         issue_number: The issue number to comment on.
         body: The comment text (markdown supported).
         token: Optional GitHub token. Falls back to GITHUB_TOKEN env var.
+        http: Optional client bound to GITHUB_API_BASE; the shared client
+            is used if omitted.
 
     Returns:
         True if the comment was posted successfully, False otherwise.
     """
-    url = f"{GITHUB_API_BASE}/repos/{repo}/issues/{issue_number}/comments"
-    headers = _build_headers(token)
-    payload = {"body": body}
-
-    try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            logger.info(
-                "POST %s — status %d",
-                url,
-                response.status_code,
-            )
-            if response.status_code == 201:
-                return True
-            logger.error(
-                "Failed to comment on %s#%d: HTTP %d",
-                repo,
-                issue_number,
-                response.status_code,
-            )
-            return False
-    except httpx.HTTPError as exc:
-        logger.error(
-            "HTTP error commenting on %s#%d: %s", repo, issue_number, exc
-        )
-        return False
-    except Exception as exc:
-        logger.error(
-            "Unexpected error commenting on %s#%d: %s", repo, issue_number, exc
-        )
-        return False
+    response = await _gh_request(
+        "POST",
+        f"/repos/{repo}/issues/{issue_number}/comments",
+        action=f"commenting on {repo}#{issue_number}",
+        headers=_build_headers(token) if token else None,
+        json={"body": body},
+        expect=(201,),
+        http=http,
+    )
+    return response is not None
 
 
 async def close_issue(
     repo: str,
     issue_number: int,
     token: Optional[str] = None,
+    http: Optional[httpx.AsyncClient] = None,
 ) -> bool:
     """Close a GitHub issue.
 
@@ -147,41 +373,21 @@ async def close_issue(
         repo: Repository in 'owner/name' format.
         issue_number: The issue number to close.
         token: Optional GitHub token. Falls back to GITHUB_TOKEN env var.
+        http: Optional client bound to GITHUB_API_BASE; the shared client
+            is used if omitted.
 
     Returns:
         True if the issue was closed successfully, False otherwise.
     """
-    url = f"{GITHUB_API_BASE}/repos/{repo}/issues/{issue_number}"
-    headers = _build_headers(token)
-    payload = {"state": "closed"}
-
-    try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.patch(url, headers=headers, json=payload)
-            logger.info(
-                "PATCH %s — status %d",
-                url,
-                response.status_code,
-            )
-            if response.status_code == 200:
-                return True
-            logger.error(
-                "Failed to close %s#%d: HTTP %d",
-                repo,
-                issue_number,
-                response.status_code,
-            )
-            return False
-    except httpx.HTTPError as exc:
-        logger.error(
-            "HTTP error closing %s#%d: %s", repo, issue_number, exc
-        )
-        return False
-    except Exception as exc:
-        logger.error(
-            "Unexpected error closing %s#%d: %s", repo, issue_number, exc
-        )
-        return False
+    response = await _gh_request(
+        "PATCH",
+        f"/repos/{repo}/issues/{issue_number}",
+        action=f"closing {repo}#{issue_number}",
+        headers=_build_headers(token) if token else None,
+        json={"state": "closed"},
+        http=http,
+    )
+    return response is not None
 
 
 async def get_file_content(
@@ -189,50 +395,38 @@ async def get_file_content(
     path: str,
     branch: str = "main",
     token: Optional[str] = None,
+    http: Optional[httpx.AsyncClient] = None,
 ) -> Optional[str]:
     """Get raw file content from a GitHub repo.
 
-    Fetches the file via the Contents API and decodes base64 content.
+    Requests the Contents API with the raw media type, so the file body is
+    returned directly instead of as base64 inside a JSON envelope.
 
     Args:
         repo: Repository in 'owner/name' format.
         path: File path within the repository.
         branch: Branch or ref to read from.
         token: Optional GitHub token. Falls back to GITHUB_TOKEN env var.
+        http: Optional client bound to GITHUB_API_BASE; the shared client
+            is used if omitted.
 
     Returns:
-        Decoded file content as a string, or None on error.
+        File content as a string, or None on error.
     """
-    url = f"{GITHUB_API_BASE}/repos/{repo}/contents/{path}"
+    url = f"/repos/{repo}/contents/{path}"
     params = {"ref": branch}
-    headers = _build_headers(token)
+    headers = {**(_build_headers(token) if token else {}), "Accept": RAW_MEDIA_TYPE}
+    cache_key, cached = await _cache_lookup(url, params, headers, http)
 
-    try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url, headers=headers, params=params)
-            logger.info(
-                "GET %s — status %d",
-                url,
-                response.status_code,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                content_b64 = data.get("content", "")
-                return base64.b64decode(content_b64).decode("utf-8")
-            logger.error(
-                "Failed to get file %s/%s: HTTP %d",
-                repo,
-                path,
-                response.status_code,
-            )
-            return None
-    except httpx.HTTPError as exc:
-        logger.error(
-            "HTTP error getting file %s/%s: %s", repo, path, exc
-        )
-        return None
-    except Exception as exc:
-        logger.error(
-            "Unexpected error getting file %s/%s: %s", repo, path, exc
-        )
+    response = await _gh_request(
+        "GET",
+        url,
+        action=f"getting file {repo}/{path}",
+        headers=_conditional_headers(headers, cached),
+        params=params,
+        expect=(200, 304),
+        http=http,
+    )
+    if response is None:
         return None
+    return await _cached_body(response, cache_key, cached)
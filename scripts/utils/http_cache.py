@@ -0,0 +1,91 @@
+"""On-disk ETag cache for conditional HTTP requests.
+
+Stores the last ``ETag`` and response body seen for a request under
+``data/.http_cache/`` so callers can send ``If-None-Match`` and reuse the
+cached body when the server answers ``304 Not Modified``.
+
+Entries are keyed by URL, ``Accept`` header, and a digest of the
+``Authorization`` header (see cache_key()), so a body fetched in one media
+type or under one token is never served for another. The cache is
+local-only: CI runs start without it, and because each workflow run gets a
+fresh ``GITHUB_TOKEN`` its entries would not match a later run anyway.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Mapping, Optional
+
+from scripts.utils.config import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Cache directory relative to project root
+_CACHE_DIR = PROJECT_ROOT / "data" / ".http_cache"
+
+
+def cache_key(url: str, headers: Optional[Mapping[str, str]] = None) -> str:
+    """Build the cache key for a request.
+
+    The ``Authorization`` value is folded in as a digest so the raw token
+    never reaches the cache directory.
+
+    Args:
+        url: The full request URL, including query string.
+        headers: The headers the request is sent with, client defaults
+            included.
+
+    Returns:
+        A key combining the URL, Accept header, and auth identity.
+    """
+    normalized = {k.lower(): v for k, v in (headers or {}).items()}
+    auth = normalized.get("authorization")
+    identity = (
+        hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16] if auth else "anonymous"
+    )
+    return f"{normalized.get('accept', '*/*')} {url} {identity}"
+
+
+def _get_cache_path(key: str) -> Path:
+    """Return the cache file path for a given cache key."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return _CACHE_DIR / f"{digest}.json"
+
+
+def get(key: str) -> Optional[tuple[str, str]]:
+    """Look up the cached ETag and body for a request.
+
+    Args:
+        key: The request's cache key, usually from cache_key().
+
+    Returns:
+        Tuple of (etag, body), or None on miss or read error.
+    """
+    cache_path = _get_cache_path(key)
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        return entry["etag"], entry["body"]
+    except (json.JSONDecodeError, KeyError, OSError):
+        logger.debug("HTTP cache read error for %s — treating as miss", key)
+        return None
+
+
+def put(key: str, etag: str, body: str) -> None:
+    """Store the ETag and body returned for a request.
+
+    Args:
+        key: The request's cache key, usually from cache_key().
+        etag: The response's ``ETag`` header value.
+        body: The decoded response body.
+    """
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_get_cache_path(key), "w", encoding="utf-8") as f:
+            json.dump({"key": key, "etag": etag, "body": body}, f)
+    except OSError:
+        logger.warning("Failed to write HTTP cache for %s", key)
@@ -1,21 +1,31 @@
 """Generic career page scraper and GitHub repo monitor.
 
-Provides GenericScraper for scraping career pages via httpx + BeautifulSoup,
+Provides GenericScraper for scraping career pages via httpx + selectolax,
 and monitor_github_repo for tracking new listings from other GitHub repos.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import random
 import re
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import SplitResult, urljoin, urlparse, urlsplit
 
 import httpx
 from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -23,7 +33,15 @@ from tenacity import (
     wait_exponential,
 )
 
-from scripts.utils.config import GitHubMonitor, ScrapeSource, get_config, PROJECT_ROOT
+from scripts.utils.ats_clients import _slugify
+from scripts.utils.config import (
+    DEFAULT_MAX_CONCURRENT_FETCHES,
+    GitHubMonitor,
+    ScrapeSource,
+    get_config,
+    PROJECT_ROOT,
+)
+from scripts.utils.fanout import collect_listings
 from scripts.utils.models import RawListing
 
 logger = logging.getLogger(__name__)
@@ -36,40 +54,215 @@ USER_AGENT = (
 # Default intern-related keywords used to identify internship links/titles.
 INTERN_KEYWORDS = ("intern", "internship", "co-op", "coop")
 
+# README table parsing (GitHub monitors).
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\((https?://[^)]+)\)")
+_HTML_HREF_RE = re.compile(r'href="(https?://[^"]+)"')
+_HTTP_URL_RE = re.compile(r"https?://")
+_LOCATION_SEPARATORS_RE = re.compile(r"[,\s]{2,}")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Bold/italic (group 1) or a markdown link (group 2), both replaced by their text.
+_MD_MARKUP_RE = re.compile(r"\*{1,3}([^*]+)\*{1,3}|\[([^\]]*)\]\([^)]*\)")
+_EMOJI_RE = re.compile(
+    r"[\U0001f300-\U0001f9ff\u2600-\u26ff\u2700-\u27bf\U0001fa00-\U0001faff]+"
+)
+# First-cell values that mark a README table header or legend row.
+_HEADER_FIRST_CELLS = frozenset({"company", "symbol", "legend"})
+
+# One state file per monitored repo, so saves never rewrite other repos' state.
+MONITOR_STATE_DIR = PROJECT_ROOT / "data" / "monitor_state"
+
+# How long a fetched robots.txt verdict is reused for the same origin.
+ROBOTS_CACHE_TTL = 3600.0
+
+# Elements whose class attribute marks them as a job listing container.
+_JOB_CONTAINER_TAGS = frozenset({"div", "li", "article", "tr"})
+_JOB_CLASS_TOKENS = (
+    "job", "position", "opening", "listing", "posting", "career", "role",
+    "opportunity",
+)
+
+# Elements whose class attribute marks them as holding a location, as one
+# case-insensitive CSS selector list.
+_LOCATION_CLASS_TOKENS = ("location", "city", "place", "region")
+_NEARBY_LOCATION_SELECTOR = ", ".join(
+    f"{tag}[class*={token} i]"
+    for tag in ("span", "div", "p")
+    for token in _LOCATION_CLASS_TOKENS
+)
+_CONTAINER_LOCATION_SELECTOR = ", ".join(
+    f"{tag}[class*={token} i]"
+    for tag in ("span", "div", "p", "td")
+    for token in _LOCATION_CLASS_TOKENS
+)
+# How many ancestors of an anchor are searched for a location element.
+_NEARBY_LOCATION_DEPTH = 2
+
+# Fallback location text such as "San Francisco, CA".
+_CITY_STATE_RE = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2}")
+
+
+def _keyword_pattern(
+    keywords: tuple[str, ...], word_boundary: bool
+) -> Optional[re.Pattern[str]]:
+    """Compile keywords into one alternation that matches any of them in a single scan.
+
+    Args:
+        keywords: Keywords to match (lowercased before compiling).
+        word_boundary: Require each keyword to match as a whole word.
+
+    Returns:
+        The compiled pattern, or None when there are no keywords.
+    """
+    if not keywords:
+        return None
+    alternation = "|".join(re.escape(kw.lower()) for kw in keywords)
+    if word_boundary:
+        return re.compile(rf"\b(?:{alternation})\b")
+    return re.compile(alternation)
+
+
+def _resolve_href(href: str, base_url: str, base: SplitResult) -> str:
+    """Resolve ``href`` against a page URL whose split form is ``base``.
+
+    Absolute, protocol-relative and root-relative links are joined by
+    concatenation; anything else falls back to ``urljoin``.
+    """
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("//"):
+        return f"{base.scheme}:{href}"
+    if href.startswith("/"):
+        return f"{base.scheme}://{base.netloc}{href}"
+    return urljoin(base_url, href)
+
+
+def _job_containers(anchor: LexborNode) -> list[LexborNode]:
+    """Return the ancestors of ``anchor`` that look like job listings, nearest first."""
+    containers: list[LexborNode] = []
+    node = anchor.parent
+    while node is not None:
+        if node.tag in _JOB_CONTAINER_TAGS:
+            classes = (node.attributes.get("class") or "").lower()
+            if classes and any(token in classes for token in _JOB_CLASS_TOKENS):
+                containers.append(node)
+        node = node.parent
+    return containers
+
+
+@asynccontextmanager
+async def _client_session(
+    http: Optional[httpx.AsyncClient],
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield ``http`` if given, else a short-lived client closed on exit."""
+    if http is not None:
+        yield http
+        return
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT},
+        timeout=15.0,
+        follow_redirects=True,
+    ) as client:
+        yield client
+
 
 class _DomainRateLimiter:
-    """Tracks per-domain request timestamps to enforce rate limits."""
+    """Per-domain token bucket enforcing a long-run request rate.
+
+    Each domain may burst up to ``capacity`` requests (e.g. robots.txt and
+    the page right after it) before being held to ``max_per_second``.
+    When a request has to wait, a small random jitter is added so repeated
+    hits on one domain don't land on a fixed cadence.
+    """
 
-    def __init__(self, max_per_second: float = 2.0):
-        self._min_interval = 1.0 / max_per_second
-        self._last_request: dict[str, float] = {}
+    def __init__(
+        self,
+        max_per_second: float = 2.0,
+        capacity: float = 4.0,
+        max_jitter: float = 0.5,
+    ):
+        self._rate = max_per_second
+        self._capacity = capacity
+        self._max_jitter = max_jitter
+        # domain -> (tokens, monotonic time of last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
 
     async def wait(self, domain: str) -> None:
         now = time.monotonic()
-        last = self._last_request.get(domain, 0.0)
-        elapsed = now - last
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
-        self._last_request[domain] = time.monotonic()
+        tokens, last = self._buckets.get(domain, (self._capacity, now))
+        tokens = min(self._capacity, tokens + (now - last) * self._rate)
+        # Take the token up front so concurrent waiters queue behind it
+        tokens -= 1.0
+        self._buckets[domain] = (tokens, now)
+        if tokens < 0:
+            jitter = random.uniform(0, self._max_jitter)
+            await asyncio.sleep(-tokens / self._rate + jitter)
 
 
 class GenericScraper:
     """Scrapes career pages for internship listings.
 
-    Uses httpx.AsyncClient with rate limiting, retries, and randomized delays.
-    Parses HTML with BeautifulSoup + lxml to find intern-related links.
+    Uses httpx.AsyncClient with per-domain rate limiting and retries.
+    Parses HTML with selectolax (lexbor) to find intern-related links.
+
+    Every request goes through one long-lived client so keep-alive and
+    HTTP/2 connections are reused across pages and robots.txt fetches.
+    Use as ``async with GenericScraper() as scraper:`` (or call
+    ``aclose()``) to release a client the scraper created itself.
+
+    Args:
+        http: Optional shared client owned by the caller. When omitted,
+            the scraper creates its own client on first use.
     """
 
-    def __init__(self) -> None:
+    _http: Optional[httpx.AsyncClient] = None
+    _owned_http: Optional[httpx.AsyncClient] = None
+
+    def __init__(self, http: Optional[httpx.AsyncClient] = None) -> None:
+        self._http = http
         self._rate_limiter = _DomainRateLimiter(max_per_second=2.0)
+        # origin -> (expiry on the monotonic clock, allowed)
+        self._robots_cache: dict[str, tuple[float, bool]] = {}
         self._config = get_config()
-        self._intern_keywords: list[str] = (
-            self._config.filters.keywords_include or list(INTERN_KEYWORDS)
+        # Keyword matchers are compiled once; every anchor on every page reuses them.
+        self._intern_pattern = _keyword_pattern(
+            tuple(self._config.filters.keywords_include or INTERN_KEYWORDS), True
         )
-        self._exclude_keywords: list[str] = (
-            self._config.filters.keywords_exclude or []
+        self._exclude_pattern = _keyword_pattern(
+            tuple(self._config.filters.keywords_exclude), False
         )
 
+    async def __aenter__(self) -> "GenericScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client this scraper created, if any.
+
+        An injected client is left open for its owner to close.
+        """
+        if self._owned_http is not None:
+            await self._owned_http.aclose()
+            self._owned_http = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the injected client, or this scraper's own (created on first use)."""
+        if self._http is not None:
+            return self._http
+        if self._owned_http is None or self._owned_http.is_closed:
+            self._owned_http = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=15.0,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=20
+                ),
+            )
+        return self._owned_http
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -107,11 +300,9 @@ class GenericScraper:
             logger.warning("Empty response from %s", source.url)
             return []
 
-        # Randomized delay between scrapes
-        await asyncio.sleep(random.uniform(1, 3))
-
-        soup = BeautifulSoup(html, "lxml")
-        listings = self._extract_listings(soup, source)
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(["script", "style"])
+        listings = self._extract_listings(tree, source)
         logger.info(
             "Found %d intern listings on %s career page",
             len(listings),
@@ -119,9 +310,35 @@ class GenericScraper:
         )
         return listings
 
+    async def scrape_all(
+        self,
+        sources: list[ScrapeSource],
+        concurrency: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+    ) -> list[RawListing]:
+        """Scrape several career pages concurrently.
+
+        At most ``concurrency`` pages are in flight at once; requests to the
+        same domain are still spaced out by the per-domain rate limiter.
+
+        Args:
+            sources: ScrapeSource entries to scrape.
+            concurrency: Maximum number of pages scraped at the same time.
+
+        Returns:
+            Combined RawListing objects from every source that succeeded.
+        """
+        return await collect_listings(
+            sources, self.scrape_career_page, "Scraping",
+            describe=lambda source: source.company,
+            max_concurrent=concurrency,
+        )
+
     async def check_robots_txt(self, base_url: str) -> bool:
         """Check if our User-Agent is allowed by robots.txt.
 
+        The verdict for each origin is cached for ROBOTS_CACHE_TTL seconds,
+        so scraping several pages on one host fetches robots.txt once.
+
         Args:
             base_url: The URL whose domain we check robots.txt for.
 
@@ -129,24 +346,28 @@ class GenericScraper:
             True if scraping is allowed or robots.txt doesn't exist.
         """
         parsed = urlparse(base_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        origin = f"{parsed.scheme}://{parsed.netloc}"
         domain = parsed.netloc
 
+        cached = self._robots_cache.get(origin)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         await self._rate_limiter.wait(domain)
 
         try:
-            async with httpx.AsyncClient(
-                headers={"User-Agent": USER_AGENT},
-                timeout=10.0,
-                follow_redirects=True,
-            ) as client:
-                resp = await client.get(robots_url)
+            resp = await self._client().get(f"{origin}/robots.txt", timeout=10.0)
 
             if resp.status_code != 200:
                 # No robots.txt or error fetching — allow by default
-                return True
+                allowed = True
+            else:
+                allowed = self._parse_robots_txt(resp.text)
 
-            return self._parse_robots_txt(resp.text)
+            self._robots_cache[origin] = (
+                time.monotonic() + ROBOTS_CACHE_TTL, allowed
+            )
+            return allowed
 
         except (httpx.HTTPError, httpx.TimeoutException):
             # If we can't fetch robots.txt, assume allowed
@@ -173,173 +394,143 @@ class GenericScraper:
         domain = urlparse(url).netloc
         await self._rate_limiter.wait(domain)
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": USER_AGENT},
-            timeout=15.0,
-            follow_redirects=True,
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.text
+        resp = await self._client().get(url)
+        resp.raise_for_status()
+        return resp.text
 
     def _extract_listings(
-        self, soup: BeautifulSoup, source: ScrapeSource
+        self, tree: LexborHTMLParser, source: ScrapeSource
     ) -> list[RawListing]:
         """Parse HTML and extract internship-related links.
 
-        Looks for <a> tags whose text or href contains intern keywords.
-        Also searches common job listing container patterns.
+        Walks every <a href> once, in document order, and emits at most one
+        listing per URL. An anchor becomes a listing when its own text or
+        href contains intern keywords (and no exclude keywords), or when it
+        is the first link inside a job-ish container (div/li with class
+        containing "job", "position", "opening", ...) whose text does.
+
+        A container is only ever represented by its first link: if that
+        link's URL was already emitted, the container yields nothing.
+        Nested containers are tried outermost first. Keyword links without
+        a nearby location or text of their own take them from their
+        nearest container.
         """
         results: list[RawListing] = []
         seen_urls: set[str] = set()
+        seen_containers: set[int] = set()
 
         base_url = source.url
-        company_slug = re.sub(r"[^a-z0-9]+", "-", source.company.lower()).strip("-")
-
-        # Strategy 1: Find all <a> tags with intern keywords in text or href
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"]
-            link_text = anchor.get_text(strip=True)
-
-            # Combine text + href for keyword matching
-            searchable = f"{link_text} {href}".lower()
-
-            if not self._matches_intern_keywords(searchable):
-                continue
+        base = urlsplit(base_url)
+        company_slug = _slugify(source.company)
 
-            if self._matches_exclude_keywords(searchable):
-                continue
-
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
+        for anchor in tree.css("a[href]"):
+            href = anchor.attributes.get("href") or ""
+            full_url = _resolve_href(href, base_url, base)
 
+            containers = _job_containers(anchor)
+            # Only the first link of a container stands in for it
+            fresh = [c for c in containers if c.mem_id not in seen_containers]
+            seen_containers.update(c.mem_id for c in fresh)
             if full_url in seen_urls:
                 continue
-            seen_urls.add(full_url)
 
-            # Try to extract location from nearby elements
-            location = self._extract_nearby_location(anchor)
+            link_text = anchor.text(strip=True)
+            container = containers[0] if containers else None
 
-            listing = RawListing(
-                company=source.company,
-                company_slug=company_slug,
-                title=link_text or "Unknown Role",
-                location=location,
-                url=full_url,
-                source="scrape",
-                is_faang_plus=source.is_faang_plus,
-                raw_data={"link_text": link_text, "href": href},
+            # Combine text + href for keyword matching, lowercased once
+            searchable_lc = f"{link_text} {href}".lower()
+            keyword_link = (
+                self._matches_intern_keywords_lc(searchable_lc)
+                and not self._matches_exclude_keywords_lc(searchable_lc)
             )
-            results.append(listing)
-
-        # Strategy 2: Look for common job listing containers
-        # (div/li with class containing "job", "position", "opening", "listing")
-        job_containers = soup.find_all(
-            ["div", "li", "article", "tr"],
-            class_=re.compile(
-                r"job|position|opening|listing|posting|career|role|opportunity",
-                re.IGNORECASE,
-            ),
-        )
-
-        for container in job_containers:
-            text = container.get_text(" ", strip=True).lower()
-            if not self._matches_intern_keywords(text):
-                continue
-            if self._matches_exclude_keywords(text):
-                continue
-
-            # Find the first link inside this container
-            link = container.find("a", href=True)
-            if not link:
-                continue
-
-            full_url = urljoin(base_url, link["href"])
-            if full_url in seen_urls:
-                continue
-            seen_urls.add(full_url)
+            if keyword_link:
+                location = self._extract_nearby_location(anchor)
+                if location == "Unknown" and container is not None:
+                    location = self._extract_location_from_container(container)
+                raw_data: dict[str, Any] = {"link_text": link_text, "href": href}
+            else:
+                for container in reversed(fresh):
+                    text = container.text(separator=" ", strip=True, skip_empty=True)
+                    text_lc = text.lower()
+                    if not self._matches_intern_keywords_lc(text_lc):
+                        continue
+                    if not self._matches_exclude_keywords_lc(text_lc):
+                        break
+                else:
+                    continue
+                location = self._extract_location_from_container(container, text)
+                raw_data = {"container_text": text_lc[:500]}
 
-            title = link.get_text(strip=True)
-            if not title:
+            title = link_text
+            if not title and container is not None:
                 # Try the first heading or strong tag
-                heading = container.find(["h1", "h2", "h3", "h4", "strong"])
-                title = heading.get_text(strip=True) if heading else "Unknown Role"
+                heading = container.css_first("h1, h2, h3, h4, strong")
+                title = heading.text(strip=True) if heading else ""
 
-            location = self._extract_location_from_container(container)
-
-            listing = RawListing(
-                company=source.company,
-                company_slug=company_slug,
-                title=title,
-                location=location,
-                url=full_url,
-                source="scrape",
-                is_faang_plus=source.is_faang_plus,
-                raw_data={"container_text": text[:500]},
+            seen_urls.add(full_url)
+            results.append(
+                RawListing(
+                    company=source.company,
+                    company_slug=company_slug,
+                    title=title or "Unknown Role",
+                    location=location,
+                    url=full_url,
+                    source="scrape",
+                    is_faang_plus=source.is_faang_plus,
+                    raw_data=raw_data,
+                )
             )
-            results.append(listing)
 
         return results
 
-    def _matches_intern_keywords(self, text: str) -> bool:
-        """Check if text contains any intern-related keywords (word-boundary match)."""
-        text_lower = text.lower()
-        for kw in self._intern_keywords:
-            if re.search(r'\b' + re.escape(kw) + r'\b', text_lower):
-                return True
-        return False
+    def _matches_intern_keywords_lc(self, text_lc: str) -> bool:
+        """Check if already-lowercased text contains an intern keyword (word-boundary match)."""
+        pattern = self._intern_pattern
+        return pattern is not None and pattern.search(text_lc) is not None
 
-    def _matches_exclude_keywords(self, text: str) -> bool:
-        """Check if text contains any excluded keywords (senior, staff, etc.)."""
-        text_lower = text.lower()
-        return any(kw in text_lower for kw in self._exclude_keywords)
+    def _matches_exclude_keywords_lc(self, text_lc: str) -> bool:
+        """Check if already-lowercased text contains an excluded keyword (senior, staff, etc.)."""
+        pattern = self._exclude_pattern
+        return pattern is not None and pattern.search(text_lc) is not None
 
-    def _extract_nearby_location(self, anchor) -> str:
+    def _extract_nearby_location(self, anchor: LexborNode) -> str:
         """Try to find a location string near an anchor element.
 
         Looks at parent and sibling elements for location-like text.
         """
-        # Check parent for location elements
-        parent = anchor.parent
-        if parent:
-            # Common patterns: a sibling span/div with class "location"
-            loc_el = parent.find(
-                ["span", "div", "p"],
-                class_=re.compile(r"location|city|place|region", re.IGNORECASE),
-            )
-            if loc_el:
-                return loc_el.get_text(strip=True)
-
-            # Check grandparent too
-            grandparent = parent.parent
-            if grandparent:
-                loc_el = grandparent.find(
-                    ["span", "div", "p"],
-                    class_=re.compile(
-                        r"location|city|place|region", re.IGNORECASE
-                    ),
-                )
-                if loc_el:
-                    return loc_el.get_text(strip=True)
+        # Common patterns: a sibling span/div with class "location", either
+        # next to the link or one level further up
+        node = anchor.parent
+        for _ in range(_NEARBY_LOCATION_DEPTH):
+            if node is None:
+                break
+            loc_el = node.css_first(_NEARBY_LOCATION_SELECTOR)
+            if loc_el is not None:
+                return loc_el.text(strip=True)
+            node = node.parent
 
         return "Unknown"
 
-    def _extract_location_from_container(self, container) -> str:
-        """Extract location from a job listing container element."""
-        loc_el = container.find(
-            ["span", "div", "p", "td"],
-            class_=re.compile(r"location|city|place|region", re.IGNORECASE),
-        )
-        if loc_el:
-            return loc_el.get_text(strip=True)
+    def _extract_location_from_container(
+        self, container: LexborNode, text: Optional[str] = None
+    ) -> str:
+        """Extract location from a job listing container element.
+
+        Args:
+            container: The job listing container node.
+            text: The container's text if the caller already extracted it,
+                reused for the "City, ST" fallback.
+        """
+        loc_el = container.css_first(_CONTAINER_LOCATION_SELECTOR)
+        if loc_el is not None:
+            return loc_el.text(strip=True)
 
         # Look for text that looks like "City, ST" pattern
-        text = container.get_text(" ", strip=True)
-        match = re.search(
-            r"([A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s*[A-Z]{2})", text
-        )
+        if text is None:
+            text = container.text(separator=" ", strip=True, skip_empty=True)
+        match = _CITY_STATE_RE.search(text)
         if match:
-            return match.group(1)
+            return match.group()
 
         return "Unknown"
 
@@ -385,15 +576,72 @@ class GenericScraper:
 # ======================================================================
 
 
-async def monitor_github_repo(monitor: GitHubMonitor) -> list[RawListing]:
+async def monitor_all(
+    monitors: list[GitHubMonitor],
+    http: Optional[httpx.AsyncClient] = None,
+    concurrency: int = DEFAULT_MAX_CONCURRENT_FETCHES,
+) -> list[RawListing]:
+    """Monitor several GitHub repos, loading and saving their state once.
+
+    Every repo's state is loaded up front, the READMEs are fetched
+    concurrently through one client, and only the states that changed are
+    written back once all monitors have finished.
+
+    Args:
+        monitors: GitHubMonitor configs to poll.
+        http: Optional shared client; a short-lived one is used if omitted.
+        concurrency: Maximum number of READMEs fetched at the same time.
+
+    Returns:
+        Combined RawListing objects for newly discovered entries.
+    """
+    states = {
+        monitor.repo: _load_monitor_state(MONITOR_STATE_DIR, monitor.repo)
+        for monitor in monitors
+    }
+    loaded = dict(states)
+
+    async with _client_session(http) as client:
+        listings = await collect_listings(
+            monitors,
+            lambda monitor: monitor_github_repo(monitor, client, states),
+            "GitHub monitors",
+            describe=lambda monitor: monitor.repo,
+            unit="repos",
+            max_concurrent=concurrency,
+        )
+
+    for repo, entry in states.items():
+        if entry is not loaded[repo]:
+            _save_monitor_state(
+                MONITOR_STATE_DIR,
+                repo,
+                entry["urls"],
+                entry["etag"],
+                entry["content_hash"],
+            )
+
+    return listings
+
+
+async def monitor_github_repo(
+    monitor: GitHubMonitor,
+    http: Optional[httpx.AsyncClient] = None,
+    state: Optional[dict[str, dict[str, Any]]] = None,
+) -> list[RawListing]:
     """Monitor a GitHub repo's README for new internship listings.
 
     Fetches the raw README markdown, parses tables for job listings,
-    diffs against previously seen URLs (stored in data/monitor_state.json),
-    and returns only newly added entries.
+    diffs against previously seen URLs (stored in data/monitor_state/),
+    and returns only newly added entries. The README is requested with
+    the last seen ETag, so an unchanged file costs a bodyless 304.
 
     Args:
         monitor: A GitHubMonitor config with repo, branch, file.
+        http: Optional shared client; a short-lived one is used if omitted.
+        state: Optional repo -> state mapping preloaded by ``monitor_all``.
+            When given, the repo's new state is stored in it instead of
+            being written to disk.
 
     Returns:
         List of RawListing objects for newly discovered entries.
@@ -410,13 +658,20 @@ async def monitor_github_repo(monitor: GitHubMonitor) -> list[RawListing]:
         monitor.file,
     )
 
+    if state is not None and monitor.repo in state:
+        repo_state = state[monitor.repo]
+    else:
+        repo_state = _load_monitor_state(MONITOR_STATE_DIR, monitor.repo)
+    headers = (
+        {"If-None-Match": repo_state["etag"]} if repo_state["etag"] else None
+    )
+
     try:
-        async with httpx.AsyncClient(
-            headers={"User-Agent": USER_AGENT},
-            timeout=15.0,
-            follow_redirects=True,
-        ) as client:
-            resp = await client.get(raw_url)
+        async with _client_session(http) as client:
+            resp = await client.get(raw_url, headers=headers)
+            if resp.status_code == 304:
+                logger.info("GitHub monitor %s: README unchanged", monitor.repo)
+                return []
             resp.raise_for_status()
             content = resp.text
     except httpx.HTTPStatusError as exc:
@@ -428,26 +683,32 @@ async def monitor_github_repo(monitor: GitHubMonitor) -> list[RawListing]:
         logger.exception("Error fetching GitHub repo %s", monitor.repo)
         return []
 
+    # A byte-identical README (e.g. served without an ETag) yields the same
+    # URL set, so skip parsing and only refresh last_checked
+    etag = resp.headers.get("ETag")
+    content_hash = hashlib.blake2b(
+        content.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    if content_hash == repo_state["content_hash"]:
+        _store_monitor_state(
+            state, monitor.repo, repo_state["urls"], etag, content_hash
+        )
+        logger.info("GitHub monitor %s: README unchanged", monitor.repo)
+        return []
+
     # Parse markdown tables for job listings
     current_entries = _parse_readme_table(content, monitor.repo)
 
-    # Load previous state
-    state_path = PROJECT_ROOT / "data" / "monitor_state.json"
-    previous_urls = _load_monitor_state(state_path, monitor.repo)
-
     # Diff: only new entries
     current_urls = {entry["url"] for entry in current_entries}
-    new_urls = current_urls - previous_urls
+    new_urls = current_urls - repo_state["urls"]
 
     new_listings: list[RawListing] = []
     for entry in current_entries:
         if entry["url"] in new_urls:
-            company_slug = re.sub(
-                r"[^a-z0-9]+", "-", entry["company"].lower()
-            ).strip("-")
             listing = RawListing(
                 company=entry["company"],
-                company_slug=company_slug,
+                company_slug=_slugify(entry["company"]),
                 title=entry["role"],
                 location=entry.get("location", "Unknown"),
                 url=entry["url"],
@@ -461,7 +722,7 @@ async def monitor_github_repo(monitor: GitHubMonitor) -> list[RawListing]:
             new_listings.append(listing)
 
     # Save updated state
-    _save_monitor_state(state_path, monitor.repo, current_urls)
+    _store_monitor_state(state, monitor.repo, current_urls, etag, content_hash)
 
     logger.info(
         "GitHub monitor %s: %d total entries, %d new",
@@ -535,7 +796,7 @@ def _parse_html_table(content: str) -> list[dict]:
                 continue
 
             # Skip header-like rows
-            if company.lower() in ("company", "symbol", "legend", "---"):
+            if company.lower() in _HEADER_FIRST_CELLS or company == "---":
                 continue
 
             # --- Role (column 1) ---
@@ -606,7 +867,7 @@ def _extract_location_cell(cell) -> str:
 
     raw = cell.get_text(separator=", ", strip=True)
     # Collapse multiple commas / whitespace
-    raw = re.sub(r"[,\s]{2,}", ", ", raw).strip(", ")
+    raw = _LOCATION_SEPARATORS_RE.sub(", ", raw).strip(", ")
     return _strip_markup(raw) if raw else "Unknown"
 
 
@@ -614,7 +875,7 @@ def _extract_first_href(cell) -> str | None:
     """Return the first ``https?://`` href found in a cell's ``<a>`` tags."""
     for anchor in cell.find_all("a", href=True):
         href = anchor["href"]
-        if re.match(r"https?://", href):
+        if _HTTP_URL_RE.match(href):
             return href
     return None
 
@@ -630,12 +891,19 @@ def _parse_markdown_pipe_table(content: str) -> list[dict]:
     entries: list[dict] = []
     last_company = ""
 
-    # Match markdown table rows (lines starting and ending with |)
-    table_row_pattern = re.compile(r"^\|(.+)\|$", re.MULTILINE)
+    for line in content.splitlines():
+        # Only table rows: lines starting and ending with |
+        if len(line) < 3 or line[0] != "|" or line[-1] != "|":
+            continue
 
-    for match in table_row_pattern.finditer(content):
-        row = match.group(1)
-        cells = [c.strip() for c in row.split("|")]
+        # Reject separator rows (|---|:--:|) and plain header rows before
+        # paying for the split
+        if not line.strip("|-: "):
+            continue
+        if line[1:].partition("|")[0].strip().lower() in _HEADER_FIRST_CELLS:
+            continue
+
+        cells = [c.strip() for c in line[1:-1].split("|")]
 
         # Skip header/separator rows
         if not cells or all(
@@ -652,11 +920,11 @@ def _parse_markdown_pipe_table(content: str) -> list[dict]:
         # Supports both markdown [text](url) and HTML <a href="url">.
         apply_url = None
         for cell in reversed(cells):
-            md_match = re.search(r"\[([^\]]*)\]\((https?://[^)]+)\)", cell)
+            md_match = _MD_LINK_RE.search(cell)
             if md_match:
                 apply_url = md_match.group(2)
                 break
-            html_match = re.search(r'href="(https?://[^"]+)"', cell)
+            html_match = _HTML_HREF_RE.search(cell)
             if html_match:
                 apply_url = html_match.group(1)
                 break
@@ -683,7 +951,7 @@ def _parse_markdown_pipe_table(content: str) -> list[dict]:
         location = _strip_markup(cells[2]) if len(cells) > 2 else "Unknown"
 
         # Skip obviously non-job rows (like header, legend)
-        if company.lower() in ("company", "symbol", "legend", "---"):
+        if company.lower() in _HEADER_FIRST_CELLS or company == "---":
             continue
 
         entries.append(
@@ -698,77 +966,133 @@ def _parse_markdown_pipe_table(content: str) -> list[dict]:
     return entries
 
 
+def _unwrap_markup(match: re.Match[str]) -> str:
+    """Replace a bold/italic span or markdown link with its (unwrapped) text."""
+    inner = match.group(1) if match.group(1) is not None else match.group(2)
+    return _MD_MARKUP_RE.sub(_unwrap_markup, inner)
+
+
 def _strip_markup(text: str) -> str:
     """Remove markdown and HTML formatting from a string."""
     # Remove HTML tags but keep inner text
-    text = re.sub(r"<[^>]+>", "", text)
-    # Remove bold/italic markdown
-    text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-    # Remove markdown links, keeping text
-    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    if "<" in text:
+        text = _HTML_TAG_RE.sub("", text)
+    # Remove bold/italic markdown and markdown links in one pass, keeping
+    # text; nested markup (e.g. a bold link) is unwrapped recursively.
+    text = _MD_MARKUP_RE.sub(_unwrap_markup, text)
+    # Pure-ASCII cells (most of a README) can hold neither emoji nor "↳"
+    if text.isascii():
+        return text.strip()
     # Remove emoji
-    text = re.sub(
-        r"[\U0001f300-\U0001f9ff\u2600-\u26ff\u2700-\u27bf\U0001fa00-\U0001faff]+",
-        "",
-        text,
-    )
+    text = _EMOJI_RE.sub("", text)
     # Remove leading/trailing whitespace and special chars
     text = text.strip().strip("↳").strip()
     return text
 
 
-def _load_monitor_state(
-    state_path: Path, repo: str
-) -> set[str]:
-    """Load previously seen URLs for a monitored repo.
+def _monitor_state_path(state_dir: Path, repo: str) -> Path:
+    """Return the state file for a repo, e.g. ``owner_name.json``."""
+    return state_dir / f"{repo.replace('/', '_')}.json"
+
+
+def _read_state_file(path: Path) -> dict[str, Any]:
+    """Read a JSON state file, returning an empty dict if missing or unreadable."""
+    if not path.exists():
+        return {}
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, OSError):
+        logger.warning("Could not load monitor state from %s", path)
+        return {}
+
+
+def _load_monitor_state(state_dir: Path, repo: str) -> dict[str, Any]:
+    """Load the saved state for a monitored repo.
+
+    Falls back to the repo's entry in the legacy single-file state
+    (``monitor_state.json`` beside ``state_dir``) until the repo's own
+    state file has been written.
 
     Args:
-        state_path: Path to monitor_state.json.
+        state_dir: Directory holding one state file per repo.
         repo: The repo identifier (e.g., "SimplifyJobs/Summer2026-Internships").
 
     Returns:
-        Set of previously seen URLs.
+        Dict with ``urls`` (set of previously seen URLs), ``etag`` (the
+        README's last ETag) and ``content_hash`` (digest of the last README
+        body); the last two are None when unknown.
     """
-    if not state_path.exists():
-        return set()
-
-    try:
-        with open(state_path, "r", encoding="utf-8") as f:
-            state = json.load(f)
-        return set(state.get(repo, {}).get("urls", []))
-    except (json.JSONDecodeError, OSError):
-        logger.warning("Could not load monitor state from %s", state_path)
-        return set()
+    path = _monitor_state_path(state_dir, repo)
+    if path.exists():
+        entry = _read_state_file(path)
+    else:
+        entry = _read_state_file(state_dir.with_suffix(".json")).get(repo, {})
+    return {
+        "urls": set(entry.get("urls", [])),
+        "etag": entry.get("etag"),
+        "content_hash": entry.get("content_hash"),
+    }
 
 
 def _save_monitor_state(
-    state_path: Path, repo: str, current_urls: set[str]
+    state_dir: Path,
+    repo: str,
+    current_urls: set[str],
+    etag: Optional[str] = None,
+    content_hash: Optional[str] = None,
 ) -> None:
-    """Save current URLs for a monitored repo to state file.
+    """Save current URLs for a monitored repo to its own state file.
 
-    Merges with existing state for other repos.
+    The file is written to a temporary path and moved into place with
+    ``os.replace``, so a crash mid-write never leaves a truncated file.
 
     Args:
-        state_path: Path to monitor_state.json.
+        state_dir: Directory holding one state file per repo.
         repo: The repo identifier.
         current_urls: Set of all URLs currently in the repo's README.
+        etag: The README response's ``ETag`` header, if any.
+        content_hash: Digest of the README body the URLs were parsed from.
     """
-    state: dict = {}
-    if state_path.exists():
-        try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            logger.warning("Could not read existing monitor state — overwriting")
-            state = {}
-
-    state[repo] = {
+    entry = {
+        "repo": repo,
         "urls": sorted(current_urls),
+        "etag": etag,
+        "content_hash": content_hash,
         "last_checked": datetime.now(timezone.utc).isoformat(),
     }
-
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(state_path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(entry, indent=2).encode("utf-8")
+
+    path = _monitor_state_path(state_dir, repo)
+    tmp_path = path.with_suffix(".json.tmp")
+    state_dir.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
 
     logger.debug("Saved monitor state for %s (%d URLs)", repo, len(current_urls))
+
+
+def _store_monitor_state(
+    state: Optional[dict[str, dict[str, Any]]],
+    repo: str,
+    current_urls: set[str],
+    etag: Optional[str],
+    content_hash: str,
+) -> None:
+    """Record a repo's new state in ``state``, or on disk when it is None."""
+    if state is None:
+        _save_monitor_state(
+            MONITOR_STATE_DIR, repo, current_urls, etag, content_hash
+        )
+    else:
+        state[repo] = {
+            "urls": current_urls,
+            "etag": etag,
+            "content_hash": content_hash,
+        }
@@ -0,0 +1,33 @@
+"""Helpers for building config models in tests without validation."""
+
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel
+
+from scripts.utils.config import AppConfig
+
+
+def _construct(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Build ``model`` from trusted data with ``model_construct``, recursing
+    into nested models and lists of models."""
+    values = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        annotation = field.annotation if field is not None else None
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = _construct(annotation, value)
+        elif get_origin(annotation) is list:
+            (item_type,) = get_args(annotation)
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                value = [_construct(item_type, item) for item in value]
+        values[name] = value
+    return model.model_construct(**values)
+
+
+def construct_app_config(data: dict[str, Any]) -> AppConfig:
+    """Build an AppConfig from a trusted fixture dict without validation.
+
+    For tests that only read the config; tests of validation itself should
+    keep using ``AppConfig.model_validate``.
+    """
+    return _construct(AppConfig, data)
@@ -1,10 +1,12 @@
 """Shared pytest fixtures for internship board tests."""
 
+import copy
 from datetime import date, datetime
 
 import pytest
 import yaml
 
+from scripts.utils.config import CONFIG_PATH, AppConfig, load_config
 from scripts.utils.models import (
     JobListing,
     JobsDatabase,
@@ -54,93 +56,142 @@ def sample_jobs_database(sample_job_listing):
     )
 
 
-@pytest.fixture
-def minimal_config_dict():
-    """Minimal valid config dict for AppConfig."""
-    return {
-        "project": {
-            "name": "Test Project",
-            "season": "summer_2026",
-            "github_repo": "test/repo",
-            "active_seasons": ["summer_2026"],
-        },
-    }
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
-@pytest.fixture
-def full_config_dict():
-    """A full config dict with all sections populated."""
-    return {
-        "project": {
-            "name": "Atlanta Tech Internships",
-            "season": "summer_2026",
-            "github_repo": "ctsc/atlanta-tech-internships-2026",
-            "active_seasons": ["summer_2026", "fall_2026", "spring_2027", "summer_2027"],
-        },
-        "georgia_focus": {
-            "priority_locations": ["Atlanta, GA", "Alpharetta, GA"],
-            "highlight_georgia": True,
-            "georgia_section_in_readme": True,
-        },
-        "greenhouse_boards": [
-            {"token": "anthropic", "company": "Anthropic", "is_faang_plus": False},
-            {"token": "openai", "company": "OpenAI", "is_faang_plus": True},
-        ],
-        "lever_boards": [
-            {"company_slug": "netflix", "company": "Netflix", "is_faang_plus": True},
-        ],
-        "ashby_boards": [
-            {"company_slug": "ramp", "company": "Ramp", "is_faang_plus": False},
-        ],
-        "scrape_sources": [
-            {
-                "company": "Google",
-                "url": "https://careers.google.com/jobs",
-                "is_faang_plus": True,
-            },
-        ],
-        "github_monitors": [
-            {
-                "repo": "SimplifyJobs/Summer2026-Internships",
-                "branch": "dev",
-                "file": "README.md",
-            },
-        ],
-        "filters": {
-            "keywords_include": ["intern", "internship"],
-            "keywords_exclude": ["senior", "staff"],
-            "role_categories": {
-                "swe": ["software engineer", "backend"],
-                "ml_ai": ["machine learning"],
-            },
-            "exclude_companies": ["Revature"],
+# Config fixture data, built once at import. Fixtures hand out the full dict
+# as-is (read-only) and a deep copy of the minimal one, which tests mutate.
+_MINIMAL_CONFIG_DICT = {
+    "project": {
+        "name": "Test Project",
+        "season": "summer_2026",
+        "github_repo": "test/repo",
+        "active_seasons": ["summer_2026"],
+    },
+}
+
+_FULL_CONFIG_DICT = {
+    "project": {
+        "name": "Atlanta Tech Internships",
+        "season": "summer_2026",
+        "github_repo": "ctsc/atlanta-tech-internships-2026",
+        "active_seasons": ["summer_2026", "fall_2026", "spring_2027", "summer_2027"],
+    },
+    "georgia_focus": {
+        "priority_locations": ["Atlanta, GA", "Alpharetta, GA"],
+        "highlight_georgia": True,
+        "georgia_section_in_readme": True,
+    },
+    "greenhouse_boards": [
+        {"token": "anthropic", "company": "Anthropic", "is_faang_plus": False},
+        {"token": "openai", "company": "OpenAI", "is_faang_plus": True},
+    ],
+    "lever_boards": [
+        {"company_slug": "netflix", "company": "Netflix", "is_faang_plus": True},
+    ],
+    "ashby_boards": [
+        {"company_slug": "ramp", "company": "Ramp", "is_faang_plus": False},
+    ],
+    "scrape_sources": [
+        {
+            "company": "Google",
+            "url": "https://careers.google.com/jobs",
+            "is_faang_plus": True,
         },
-        "ai": {
-            "model": "gemini-2.0-flash",
-            "max_tokens": 1024,
-            "enrichment_prompt": "Analyze this job listing.",
+    ],
+    "github_monitors": [
+        {
+            "repo": "SimplifyJobs/Summer2026-Internships",
+            "branch": "dev",
+            "file": "README.md",
         },
-        "schedule": {
-            "update_interval_hours": 6,
-            "link_check_interval_hours": 24,
-            "archive_after_days": 7,
+    ],
+    "filters": {
+        "keywords_include": ["intern", "internship"],
+        "keywords_exclude": ["senior", "staff"],
+        "role_categories": {
+            "swe": ["software engineer", "backend"],
+            "ml_ai": ["machine learning"],
         },
-    }
+        "exclude_companies": ["Revature"],
+    },
+    "ai": {
+        "model": "gemini-2.0-flash",
+        "max_tokens": 1024,
+        "enrichment_prompt": "Analyze this job listing.",
+    },
+    "schedule": {
+        "update_interval_hours": 6,
+        "link_check_interval_hours": 24,
+        "archive_after_days": 7,
+    },
+}
 
 
 @pytest.fixture
-def config_yaml_file(full_config_dict, tmp_path):
-    """Write a full config dict to a temp YAML file and return its Path."""
-    path = tmp_path / "config.yaml"
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(full_config_dict, f, default_flow_style=False)
-    return path
+def minimal_config_dict():
+    """Minimal valid config dict for AppConfig."""
+    return copy.deepcopy(_MINIMAL_CONFIG_DICT)
 
 
-@pytest.fixture
-def minimal_config_yaml_file(minimal_config_dict, tmp_path):
-    """Write a minimal config dict to a temp YAML file and return its Path."""
-    path = tmp_path / "minimal_config.yaml"
+@pytest.fixture(scope="session")
+def full_config_dict():
+    """A full config dict with all sections populated.
+
+    Shared across the session, so treat it as read-only; build a private
+    copy with ``copy.deepcopy`` before changing it.
+    """
+    return _FULL_CONFIG_DICT
+
+
+@pytest.fixture(scope="session")
+def full_app_config(full_config_dict):
+    """AppConfig validated once per session from ``full_config_dict``."""
+    return AppConfig.model_validate(full_config_dict)
+
+
+def _write_yaml(path, data):
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(minimal_config_dict, f, default_flow_style=False)
+        yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
     return path
+
+
+@pytest.fixture(scope="session")
+def config_yaml_file(tmp_path_factory):
+    """Write the full config dict to a YAML file once per session; return its Path.
+
+    Shared across tests, so treat the file as read-only.
+    """
+    return _write_yaml(
+        tmp_path_factory.mktemp("config") / "config.yaml", _FULL_CONFIG_DICT
+    )
+
+
+@pytest.fixture(scope="session")
+def minimal_config_yaml_file(tmp_path_factory):
+    """Write the minimal config dict to a YAML file once per session; return its Path.
+
+    Shared across tests, so treat the file as read-only.
+    """
+    return _write_yaml(
+        tmp_path_factory.mktemp("config") / "minimal_config.yaml",
+        _MINIMAL_CONFIG_DICT,
+    )
+
+
+@pytest.fixture(scope="session")
+def real_config_path():
+    """Path to the project's own config.yaml; skips the test if it is absent."""
+    if not CONFIG_PATH.exists():
+        pytest.skip("Real config.yaml not found")
+    return CONFIG_PATH
+
+
+@pytest.fixture(scope="session")
+def real_app_config(real_config_path):
+    """The project's config.yaml, parsed and validated once per session.
+
+    Shared across tests, so treat it as read-only.
+    """
+    return load_config(config_path=real_config_path)
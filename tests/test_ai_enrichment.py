@@ -675,13 +675,11 @@ class TestGetGeminiClient:
 class TestEnrichBatch:
     """Tests for batch enrichment processing."""
 
-    @pytest.mark.asyncio
     async def test_empty_list_returns_empty(self, mock_config):
         """Empty input returns empty output."""
         result = await enrich_batch([], config=mock_config)
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_preserves_order(self, raw_listing, raw_listing_2, mock_config):
         """Results are returned in the same order as input listings."""
         meta1 = {**DEFAULT_METADATA, "category": "swe"}
@@ -702,7 +700,6 @@ class TestEnrichBatch:
         assert result[0]["category"] == "swe"
         assert result[1]["category"] == "ml_ai"
 
-    @pytest.mark.asyncio
     async def test_processes_in_batches_of_10(self, mock_config):
         """Listings are processed in groups of 10 with delays between groups."""
         # Create 25 listings (3 batches: 10, 10, 5)
@@ -735,7 +732,6 @@ class TestEnrichBatch:
         # Should have slept between batches (2 sleeps for 3 batches)
         assert mock_sleep.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_single_listing(self, raw_listing, mock_config, valid_metadata):
         """Single listing processed without inter-batch delay."""
 
@@ -754,7 +750,6 @@ class TestEnrichBatch:
         # No sleep for a single batch
         mock_sleep.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_exactly_10_listings_no_sleep(self, mock_config):
         """Exactly 10 listings = 1 batch, no inter-batch delay."""
         listings = [
@@ -782,7 +777,6 @@ class TestEnrichBatch:
         assert len(result) == 10
         mock_sleep.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_eleven_listings_one_sleep(self, mock_config):
         """11 listings = 2 batches, 1 inter-batch delay."""
         listings = [
@@ -810,7 +804,6 @@ class TestEnrichBatch:
         assert len(result) == 11
         assert mock_sleep.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_loads_config_when_none(self, raw_listing, valid_metadata):
         """Calls get_config() when config parameter is None."""
         mock_cfg = MagicMock()
@@ -2,12 +2,12 @@
 
 import asyncio
 import json
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
-import pytest
 
 from scripts.check_links import (
     DEAD_STATUSES,
@@ -80,6 +80,37 @@ def _db_to_dict(db: JobsDatabase) -> dict:
     return json.loads(db.model_dump_json())
 
 
+@contextmanager
+def _mock_transport(respond):
+    """Route check_links' httpx.AsyncClient through an httpx.MockTransport.
+
+    Args:
+        respond: A response returned for every request, an exception to
+            raise, or a callable taking the request URL and returning (or
+            resolving to) a response.
+
+    Yields:
+        List of the requests the transport received.
+    """
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        if isinstance(respond, BaseException):
+            raise respond
+        if isinstance(respond, httpx.Response):
+            return httpx.Response(respond.status_code)
+        return respond(request.url)
+
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    with patch("scripts.check_links.httpx.AsyncClient", client_factory):
+        yield requests
+
+
 # ---------------------------------------------------------------------------
 # _load_database
 # ---------------------------------------------------------------------------
@@ -169,7 +200,6 @@ class TestLinkHealth:
 # ---------------------------------------------------------------------------
 
 class TestCheckSingleLink:
-    @pytest.mark.asyncio
     async def test_healthy_200(self):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -185,7 +215,6 @@ class TestCheckSingleLink:
         assert status == 200
         assert err is None
 
-    @pytest.mark.asyncio
     async def test_dead_404(self):
         mock_response = MagicMock()
         mock_response.status_code = 404
@@ -199,7 +228,6 @@ class TestCheckSingleLink:
         assert result_type == "dead"
         assert status == 404
 
-    @pytest.mark.asyncio
     async def test_dead_410(self):
         mock_response = MagicMock()
         mock_response.status_code = 410
@@ -213,7 +241,6 @@ class TestCheckSingleLink:
         assert result_type == "dead"
         assert status == 410
 
-    @pytest.mark.asyncio
     async def test_dead_403(self):
         mock_response = MagicMock()
         mock_response.status_code = 403
@@ -227,7 +254,6 @@ class TestCheckSingleLink:
         assert result_type == "dead"
         assert status == 403
 
-    @pytest.mark.asyncio
     async def test_transient_429(self):
         mock_response = MagicMock()
         mock_response.status_code = 429
@@ -241,7 +267,6 @@ class TestCheckSingleLink:
         assert result_type == "transient"
         assert status == 429
 
-    @pytest.mark.asyncio
     async def test_transient_500(self):
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -255,7 +280,6 @@ class TestCheckSingleLink:
         assert result_type == "transient"
         assert status == 500
 
-    @pytest.mark.asyncio
     async def test_transient_502(self):
         mock_response = MagicMock()
         mock_response.status_code = 502
@@ -268,7 +292,6 @@ class TestCheckSingleLink:
         )
         assert result_type == "transient"
 
-    @pytest.mark.asyncio
     async def test_transient_503(self):
         mock_response = MagicMock()
         mock_response.status_code = 503
@@ -281,7 +304,6 @@ class TestCheckSingleLink:
         )
         assert result_type == "transient"
 
-    @pytest.mark.asyncio
     async def test_unknown_status_301(self):
         mock_response = MagicMock()
         mock_response.status_code = 301
@@ -295,7 +317,6 @@ class TestCheckSingleLink:
         assert result_type == "unknown"
         assert status == 301
 
-    @pytest.mark.asyncio
     async def test_timeout_returns_error(self):
         client = AsyncMock()
         client.head = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
@@ -308,7 +329,6 @@ class TestCheckSingleLink:
         assert status is None
         assert err == "timeout"
 
-    @pytest.mark.asyncio
     async def test_connection_error_returns_error(self):
         client = AsyncMock()
         client.head = AsyncMock(
@@ -323,7 +343,6 @@ class TestCheckSingleLink:
         assert status is None
         assert "connection refused" in err
 
-    @pytest.mark.asyncio
     async def test_unexpected_exception_returns_error(self):
         client = AsyncMock()
         client.head = AsyncMock(side_effect=RuntimeError("unexpected"))
@@ -358,7 +377,6 @@ def _write_health_file(tmp_path: Path, health: dict) -> Path:
 class TestCheckAllLinks:
     """Integration tests for the full check_all_links() function."""
 
-    @pytest.mark.asyncio
     async def test_empty_database_returns_zero_stats(self, tmp_path: Path):
         db = _make_db([])
         jobs_path = _write_db_file(tmp_path, db)
@@ -375,7 +393,6 @@ class TestCheckAllLinks:
         assert stats["transient_errors"] == 0
         assert stats["unknown"] == 0
 
-    @pytest.mark.asyncio
     async def test_healthy_link_updates_verified_date(self, tmp_path: Path):
         listing = _make_listing(
             date_last_verified=date(2026, 1, 1),
@@ -389,12 +406,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
@@ -405,7 +417,6 @@ class TestCheckAllLinks:
         saved = json.loads(jobs_path.read_text())
         assert saved["listings"][0]["date_last_verified"] == date.today().isoformat()
 
-    @pytest.mark.asyncio
     async def test_dead_link_first_failure_stays_open(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -417,12 +428,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
@@ -435,7 +441,6 @@ class TestCheckAllLinks:
         saved_health = json.loads(health_path.read_text())
         assert saved_health["abc123"]["consecutive_failures"] == 1
 
-    @pytest.mark.asyncio
     async def test_dead_link_second_failure_marks_closed(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -449,12 +454,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
@@ -465,7 +465,6 @@ class TestCheckAllLinks:
         saved_health = json.loads(health_path.read_text())
         assert saved_health["abc123"]["consecutive_failures"] == 2
 
-    @pytest.mark.asyncio
     async def test_410_second_failure_marks_closed(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -478,18 +477,12 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
         assert stats["closed"] == 1
 
-    @pytest.mark.asyncio
     async def test_403_second_failure_marks_closed(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -502,18 +495,12 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
         assert stats["closed"] == 1
 
-    @pytest.mark.asyncio
     async def test_healthy_resets_failure_counter(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -527,12 +514,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
@@ -540,7 +522,6 @@ class TestCheckAllLinks:
         saved_health = json.loads(health_path.read_text())
         assert saved_health["abc123"]["consecutive_failures"] == 0
 
-    @pytest.mark.asyncio
     async def test_transient_errors_not_marked_closed(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -553,12 +534,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
@@ -567,7 +543,6 @@ class TestCheckAllLinks:
         saved = json.loads(jobs_path.read_text())
         assert saved["listings"][0]["status"] == "open"
 
-    @pytest.mark.asyncio
     async def test_unknown_status_not_marked_closed(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -579,19 +554,13 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             stats = await check_all_links()
 
         assert stats["unknown"] == 1
         assert stats["closed"] == 0
 
-    @pytest.mark.asyncio
     async def test_skips_closed_listings(self, tmp_path: Path):
         open_listing = _make_listing(listing_id="open1")
         closed_listing = _make_listing(
@@ -608,20 +577,14 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response) as requests:
 
             stats = await check_all_links()
 
         # Only the open listing should be checked
         assert stats["checked"] == 1
-        assert mock_client.head.call_count == 1
+        assert len(requests) == 1
 
-    @pytest.mark.asyncio
     async def test_timeout_counted_as_transient(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -631,21 +594,13 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(
-                side_effect=httpx.TimeoutException("timed out")
-            )
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(httpx.TimeoutException("timed out")):
 
             stats = await check_all_links()
 
         assert stats["transient_errors"] == 1
         assert stats["closed"] == 0
 
-    @pytest.mark.asyncio
     async def test_network_error_counted_as_transient(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -655,21 +610,13 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(
-                side_effect=httpx.ConnectError("connection refused")
-            )
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(httpx.ConnectError("connection refused")):
 
             stats = await check_all_links()
 
         assert stats["transient_errors"] == 1
         assert stats["closed"] == 0
 
-    @pytest.mark.asyncio
     async def test_link_health_created_when_missing(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -682,12 +629,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             await check_all_links()
 
@@ -695,7 +637,6 @@ class TestCheckAllLinks:
         saved_health = json.loads(health_path.read_text())
         assert "abc123" in saved_health
 
-    @pytest.mark.asyncio
     async def test_multiple_listings_mixed_results(self, tmp_path: Path):
         healthy_listing = _make_listing(
             listing_id="healthy1", url="https://example.com/healthy"
@@ -724,12 +665,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(side_effect=mock_head)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_head):
 
             stats = await check_all_links()
 
@@ -738,7 +674,6 @@ class TestCheckAllLinks:
         assert stats["closed"] == 1
         assert stats["transient_errors"] == 1
 
-    @pytest.mark.asyncio
     async def test_stats_dict_has_all_keys(self, tmp_path: Path):
         db = _make_db([])
         jobs_path = _write_db_file(tmp_path, db)
@@ -752,7 +687,6 @@ class TestCheckAllLinks:
         expected_keys = {"checked", "healthy", "closed", "transient_errors", "unknown"}
         assert set(stats.keys()) == expected_keys
 
-    @pytest.mark.asyncio
     async def test_saves_updated_jobs_json(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -764,12 +698,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             await check_all_links()
 
@@ -778,7 +707,6 @@ class TestCheckAllLinks:
         assert "listings" in saved
         assert "last_updated" in saved
 
-    @pytest.mark.asyncio
     async def test_saves_link_health_json(self, tmp_path: Path):
         listing = _make_listing()
         db = _make_db([listing])
@@ -790,12 +718,7 @@ class TestCheckAllLinks:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_response):
 
             await check_all_links()
 
@@ -818,7 +741,6 @@ class TestConstants:
 
 
 class TestConcurrency:
-    @pytest.mark.asyncio
     async def test_semaphore_limits_concurrency(self, tmp_path: Path):
         """Verify that at most MAX_CONCURRENT requests run simultaneously."""
         listings = [
@@ -850,12 +772,7 @@ class TestConcurrency:
         with patch("scripts.check_links.JOBS_PATH", jobs_path), \
              patch("scripts.check_links.LINK_HEALTH_PATH", health_path), \
              patch("scripts.check_links.DATA_DIR", tmp_path), \
-             patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.head = mock_head
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+             _mock_transport(mock_head):
 
             stats = await check_all_links()
 
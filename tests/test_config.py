@@ -1,8 +1,10 @@
 """Tests for config loader and validation."""
 
+import os
 from pathlib import Path
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from scripts.utils.config import (
@@ -20,19 +22,33 @@ from scripts.utils.config import (
     is_big_tech,
     load_config,
 )
+from tests.config_helpers import construct_app_config
 
 
 # ── Section Model Tests ─────────────────────────────────────────────────────
 
 
+def _defaults(model):
+    """Declared defaults of a model's optional fields, read without validation."""
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+
+def _required(model):
+    """Names of a model's required fields, read without validation."""
+    return {name for name, field in model.model_fields.items() if field.is_required()}
+
+
 class TestProjectConfig:
     def test_valid(self):
         p = ProjectConfig(name="Test", season="summer_2026", github_repo="a/b")
         assert p.name == "Test"
 
     def test_active_seasons_default(self):
-        p = ProjectConfig(name="Test", season="summer_2026", github_repo="a/b")
-        assert p.active_seasons == ["summer_2026"]
+        assert _defaults(ProjectConfig) == {"active_seasons": ["summer_2026"]}
 
     def test_active_seasons_custom(self):
         p = ProjectConfig(
@@ -46,21 +62,17 @@ class TestProjectConfig:
         with pytest.raises(ValidationError):
             ProjectConfig(season="summer_2026", github_repo="a/b")
 
-    def test_missing_season(self):
-        with pytest.raises(ValidationError):
-            ProjectConfig(name="Test", github_repo="a/b")
-
-    def test_missing_github_repo(self):
-        with pytest.raises(ValidationError):
-            ProjectConfig(name="Test", season="summer_2026")
+    def test_required_fields(self):
+        assert _required(ProjectConfig) == {"name", "season", "github_repo"}
 
 
 class TestGeorgiaFocusConfig:
     def test_defaults(self):
-        g = GeorgiaFocusConfig()
-        assert g.priority_locations == []
-        assert g.highlight_georgia is True
-        assert g.georgia_section_in_readme is True
+        assert _defaults(GeorgiaFocusConfig) == {
+            "priority_locations": [],
+            "highlight_georgia": True,
+            "georgia_section_in_readme": True,
+        }
 
     def test_custom_locations(self):
         g = GeorgiaFocusConfig(priority_locations=["Atlanta, GA", "Alpharetta, GA"])
@@ -71,7 +83,9 @@ class TestGreenhouseBoard:
     def test_valid(self):
         b = GreenhouseBoard(token="anthropic", company="Anthropic")
         assert b.token == "anthropic"
-        assert b.is_faang_plus is False
+
+    def test_defaults(self):
+        assert _defaults(GreenhouseBoard) == {"is_faang_plus": False}
 
     def test_faang_plus(self):
         b = GreenhouseBoard(token="openai", company="OpenAI", is_faang_plus=True)
@@ -81,9 +95,8 @@ class TestGreenhouseBoard:
         with pytest.raises(ValidationError):
             GreenhouseBoard(company="Anthropic")
 
-    def test_missing_company(self):
-        with pytest.raises(ValidationError):
-            GreenhouseBoard(token="anthropic")
+    def test_required_fields(self):
+        assert _required(GreenhouseBoard) == {"token", "company"}
 
 
 class TestLeverBoard:
@@ -96,16 +109,17 @@ class TestLeverBoard:
         with pytest.raises(ValidationError):
             LeverBoard(company="Netflix")
 
-    def test_missing_company(self):
-        with pytest.raises(ValidationError):
-            LeverBoard(company_slug="netflix")
+    def test_required_fields(self):
+        assert _required(LeverBoard) == {"company_slug", "company"}
 
 
 class TestAshbyBoard:
     def test_valid(self):
         b = AshbyBoard(company_slug="ramp", company="Ramp")
         assert b.company_slug == "ramp"
-        assert b.is_faang_plus is False
+
+    def test_defaults(self):
+        assert _defaults(AshbyBoard) == {"is_faang_plus": False}
 
     def test_missing_slug(self):
         with pytest.raises(ValidationError):
@@ -116,7 +130,9 @@ class TestScrapeSource:
     def test_valid(self):
         s = ScrapeSource(company="Google", url="https://careers.google.com")
         assert s.company == "Google"
-        assert s.is_faang_plus is False
+
+    def test_defaults(self):
+        assert _defaults(ScrapeSource) == {"is_faang_plus": False}
 
     def test_faang_plus(self):
         s = ScrapeSource(
@@ -128,16 +144,13 @@ class TestScrapeSource:
         with pytest.raises(ValidationError):
             ScrapeSource(url="https://example.com")
 
-    def test_missing_url(self):
-        with pytest.raises(ValidationError):
-            ScrapeSource(company="Google")
+    def test_required_fields(self):
+        assert _required(ScrapeSource) == {"company", "url"}
 
 
 class TestGitHubMonitor:
-    def test_valid(self):
-        m = GitHubMonitor(repo="SimplifyJobs/Summer2026-Internships")
-        assert m.branch == "main"
-        assert m.file == "README.md"
+    def test_defaults(self):
+        assert _defaults(GitHubMonitor) == {"branch": "main", "file": "README.md"}
 
     def test_custom_branch_and_file(self):
         m = GitHubMonitor(
@@ -153,11 +166,12 @@ class TestGitHubMonitor:
 
 class TestFiltersConfig:
     def test_defaults(self):
-        f = FiltersConfig()
-        assert f.keywords_include == []
-        assert f.keywords_exclude == []
-        assert f.role_categories == {}
-        assert f.exclude_companies == []
+        assert _defaults(FiltersConfig) == {
+            "keywords_include": [],
+            "keywords_exclude": [],
+            "role_categories": {},
+            "exclude_companies": [],
+        }
 
     def test_populated(self):
         f = FiltersConfig(
@@ -173,10 +187,10 @@ class TestFiltersConfig:
 
 class TestAIConfig:
     def test_defaults(self):
-        a = AIConfig()
-        assert a.model == "gemini-2.0-flash"
-        assert a.max_tokens == 1024
-        assert a.enrichment_prompt == ""
+        defaults = _defaults(AIConfig)
+        assert defaults["model"] == "gemini-2.0-flash"
+        assert defaults["max_tokens"] == 1024
+        assert defaults["enrichment_prompt"] == ""
 
     def test_custom(self):
         a = AIConfig(model="custom-model", max_tokens=512, enrichment_prompt="Go!")
@@ -186,10 +200,11 @@ class TestAIConfig:
 
 class TestScheduleConfig:
     def test_defaults(self):
-        s = ScheduleConfig()
-        assert s.update_interval_hours == 6
-        assert s.link_check_interval_hours == 24
-        assert s.archive_after_days == 7
+        assert _defaults(ScheduleConfig) == {
+            "update_interval_hours": 6,
+            "link_check_interval_hours": 24,
+            "archive_after_days": 7,
+        }
 
     def test_custom(self):
         s = ScheduleConfig(
@@ -213,26 +228,24 @@ class TestAppConfig:
         assert config.scrape_sources == []
         assert config.total_sources == 0
 
-    def test_full_config(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
-        assert config.project.github_repo == "ctsc/atlanta-tech-internships-2026"
-        assert len(config.greenhouse_boards) == 2
-        assert len(config.lever_boards) == 1
-        assert len(config.ashby_boards) == 1
-        assert len(config.scrape_sources) == 1
-        assert len(config.github_monitors) == 1
-        assert config.total_sources == 6  # 2 + 1 + 1 + 1 + 1
-
-    def test_total_sources_property(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
+    def test_full_config(self, full_app_config):
+        assert full_app_config.project.github_repo == "ctsc/atlanta-tech-internships-2026"
+        assert len(full_app_config.greenhouse_boards) == 2
+        assert len(full_app_config.lever_boards) == 1
+        assert len(full_app_config.ashby_boards) == 1
+        assert len(full_app_config.scrape_sources) == 1
+        assert len(full_app_config.github_monitors) == 1
+        assert full_app_config.total_sources == 6  # 2 + 1 + 1 + 1 + 1
+
+    def test_total_sources_property(self, full_app_config):
         expected = (
-            len(config.greenhouse_boards)
-            + len(config.lever_boards)
-            + len(config.ashby_boards)
-            + len(config.scrape_sources)
-            + len(config.github_monitors)
+            len(full_app_config.greenhouse_boards)
+            + len(full_app_config.lever_boards)
+            + len(full_app_config.ashby_boards)
+            + len(full_app_config.scrape_sources)
+            + len(full_app_config.github_monitors)
         )
-        assert config.total_sources == expected
+        assert full_app_config.total_sources == expected
 
     def test_missing_project_section(self):
         with pytest.raises(ValidationError):
@@ -243,30 +256,40 @@ class TestAppConfig:
             AppConfig.model_validate({"project": {"name": "No season or repo"}})
 
     def test_georgia_focus_defaults(self, minimal_config_dict):
-        config = AppConfig.model_validate(minimal_config_dict)
+        config = construct_app_config(minimal_config_dict)
         assert config.georgia_focus.highlight_georgia is True
         assert config.georgia_focus.priority_locations == []
 
-    def test_greenhouse_faang_detection(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
-        faang = [b for b in config.greenhouse_boards if b.is_faang_plus]
+    def test_greenhouse_faang_detection(self, full_app_config):
+        faang = [b for b in full_app_config.greenhouse_boards if b.is_faang_plus]
         assert len(faang) == 1
         assert faang[0].company == "OpenAI"
 
-    def test_filters_populated(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
-        assert "intern" in config.filters.keywords_include
-        assert "senior" in config.filters.keywords_exclude
-        assert "Revature" in config.filters.exclude_companies
+    def test_filters_populated(self, full_app_config):
+        assert "intern" in full_app_config.filters.keywords_include
+        assert "senior" in full_app_config.filters.keywords_exclude
+        assert "Revature" in full_app_config.filters.exclude_companies
 
-    def test_ai_model(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
-        assert config.ai.model == "gemini-2.0-flash"
+    def test_ai_model(self, full_app_config):
+        assert full_app_config.ai.model == "gemini-2.0-flash"
 
-    def test_schedule_values(self, full_config_dict):
-        config = AppConfig.model_validate(full_config_dict)
-        assert config.schedule.update_interval_hours == 6
-        assert config.schedule.archive_after_days == 7
+    def test_schedule_values(self, full_app_config):
+        assert full_app_config.schedule.update_interval_hours == 6
+        assert full_app_config.schedule.archive_after_days == 7
+
+    def test_construct_helper_matches_validation(self, full_config_dict):
+        """The unvalidated test helper builds the same config as model_validate."""
+        constructed = construct_app_config(full_config_dict)
+        assert constructed.model_dump() == AppConfig.model_validate(full_config_dict).model_dump()
+
+    def test_max_concurrent_fetches_default(self, minimal_config_dict):
+        config = AppConfig.model_validate(minimal_config_dict)
+        assert config.max_concurrent_fetches == 16
+
+    def test_max_concurrent_fetches_must_be_positive(self, minimal_config_dict):
+        minimal_config_dict["max_concurrent_fetches"] = 0
+        with pytest.raises(ValidationError):
+            AppConfig.model_validate(minimal_config_dict)
 
 
 # ── load_config() Tests ─────────────────────────────────────────────────────
@@ -305,12 +328,9 @@ class TestLoadConfig:
         with pytest.raises(ValidationError):
             load_config(config_path=no_project)
 
-    def test_load_real_config_yaml(self):
+    def test_load_real_config_yaml(self, real_app_config):
         """Load the actual project config.yaml and verify it parses."""
-        real_config = Path(__file__).resolve().parent.parent / "config.yaml"
-        if not real_config.exists():
-            pytest.skip("Real config.yaml not found")
-        config = load_config(config_path=real_config)
+        config = real_app_config
         assert config.project.github_repo == "ctsc/atlanta-tech-internships-2026"
         assert len(config.greenhouse_boards) >= 80
         assert len(config.lever_boards) >= 20
@@ -320,10 +340,45 @@ class TestLoadConfig:
         assert len(config.georgia_focus.priority_locations) >= 10
         assert config.ai.model == "gemini-2.0-flash"
 
+    def test_fast_loader_matches_safe_load(self, real_config_path):
+        """The libyaml loader parses the real config exactly like yaml.safe_load."""
+        from scripts.utils.config import _YamlLoader
+
+        text = real_config_path.read_text(encoding="utf-8")
+        assert yaml.load(text, Loader=_YamlLoader) == yaml.safe_load(text)
+
     def test_load_config_returns_app_config_type(self, config_yaml_file):
         config = load_config(config_path=config_yaml_file)
         assert isinstance(config, AppConfig)
 
+    def test_load_config_cached_until_file_changes(self, tmp_path, minimal_config_dict):
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump(minimal_config_dict))
+        first = load_config(config_path=path)
+        assert load_config(config_path=path) is first
+
+        minimal_config_dict["project"]["name"] = "Renamed Proj"
+        path.write_text(yaml.dump(minimal_config_dict))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded = load_config(config_path=path)
+        assert reloaded is not first
+        assert reloaded.project.name == "Renamed Proj"
+
+    def test_load_config_reloads_same_tick_rewrite(self, tmp_path, minimal_config_dict):
+        """A rewrite that keeps the mtime but changes the size is not served stale."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump(minimal_config_dict))
+        stat = path.stat()
+        first = load_config(config_path=path)
+
+        minimal_config_dict["project"]["name"] = "A longer project name"
+        path.write_text(yaml.dump(minimal_config_dict))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = load_config(config_path=path)
+        assert reloaded is not first
+        assert reloaded.project.name == "A longer project name"
+
 
 # ── Big Tech Companies Tests ──────────────────────────────────────────────
 
@@ -376,12 +431,9 @@ class TestBigTechCompanies:
         config = AppConfig.model_validate(minimal_config_dict)
         assert is_big_tech("Google", config) is False
 
-    def test_real_config_has_big_tech(self):
+    def test_real_config_has_big_tech(self, real_app_config):
         """Real config.yaml should have big_tech_companies populated."""
-        real_config = Path(__file__).resolve().parent.parent / "config.yaml"
-        if not real_config.exists():
-            pytest.skip("Real config.yaml not found")
-        config = load_config(config_path=real_config)
+        config = real_app_config
         assert len(config.big_tech_companies) >= 50
         assert is_big_tech("Google", config) is True
         assert is_big_tech("Anthropic", config) is True
@@ -9,12 +9,15 @@ Tests cover:
 - discover_all(): aggregation, error isolation, JSON output saved
 """
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 import pytest
+from selectolax.lexbor import LexborHTMLParser
 
 from scripts.utils.ats_clients import (
     AshbyClient,
@@ -35,9 +38,13 @@ from scripts.utils.config import (
 )
 from scripts.utils.models import RawListing
 from scripts.utils.scraper import (
+    ROBOTS_CACHE_TTL,
     GenericScraper,
+    _DomainRateLimiter,
+    _keyword_pattern,
     _parse_html_table,
     _parse_readme_table,
+    _resolve_href,
     _strip_markup,
     monitor_github_repo,
 )
@@ -48,6 +55,20 @@ from scripts.utils.scraper import (
 # ======================================================================
 
 
+def _transport_client(respond) -> httpx.AsyncClient:
+    """Build a real AsyncClient whose requests are answered by ``respond``.
+
+    ``respond`` is either the ``httpx.Response`` to return or an exception
+    to raise from the transport.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if isinstance(respond, BaseException):
+            raise respond
+        return respond
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 @pytest.fixture
 def filters():
     """Standard filters config for testing."""
@@ -59,6 +80,24 @@ def filters():
     )
 
 
+@pytest.fixture
+def scraper_config(filters):
+    """Make GenericScraper() read its keywords from the ``filters`` fixture."""
+    with patch("scripts.utils.scraper.get_config", return_value=MagicMock(filters=filters)):
+        yield
+
+
+@pytest.fixture
+async def scraper(scraper_config):
+    """GenericScraper built through its constructor on a transport client.
+
+    The transport answers every request with an empty 200 page; tests that
+    need specific pages patch ``check_robots_txt`` and ``_fetch_page``.
+    """
+    async with _transport_client(httpx.Response(200, text="")) as http:
+        yield GenericScraper(http=http)
+
+
 @pytest.fixture
 def greenhouse_board():
     return GreenhouseBoard(token="testco", company="TestCo", is_faang_plus=False)
@@ -180,7 +219,6 @@ class TestHtmlToText:
 class TestGreenhouseClient:
     """Tests for the Greenhouse ATS client."""
 
-    @pytest.mark.asyncio
     async def test_fetch_200_with_matching_jobs(self, filters, greenhouse_board):
         """Verify that matching intern jobs are returned as RawListings."""
         mock_response = httpx.Response(
@@ -215,7 +253,30 @@ class TestGreenhouseClient:
         assert results[0].location == "San Francisco, CA"
         assert isinstance(results[0], RawListing)
 
-    @pytest.mark.asyncio
+    async def test_fetch_uses_injected_client(self, filters, greenhouse_board):
+        """An injected shared client is used for the request and left open."""
+        received = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(200, json={"jobs": []})
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            headers={"User-Agent": "shared-client/1.0"},
+        ) as http:
+            client = GreenhouseClient(filters, http)
+            with patch("scripts.utils.ats_clients.httpx.AsyncClient") as constructor:
+                results = await client.fetch_listings(greenhouse_board)
+
+            assert not http.is_closed
+
+        assert results == []
+        constructor.assert_not_called()
+        [request] = received
+        assert request.url == "https://boards-api.greenhouse.io/v1/boards/testco/jobs?content=true"
+        assert request.headers["User-Agent"] == "shared-client/1.0"
+
     async def test_fetch_200_no_matching_jobs(self, filters, greenhouse_board):
         """No listings returned when no titles match keywords."""
         mock_response = httpx.Response(
@@ -239,7 +300,6 @@ class TestGreenhouseClient:
 
         assert len(results) == 0
 
-    @pytest.mark.asyncio
     async def test_fetch_excludes_senior_intern(self, filters, greenhouse_board):
         """Exclude keyword 'senior' filters out 'Senior Intern' titles."""
         mock_response = httpx.Response(
@@ -263,7 +323,6 @@ class TestGreenhouseClient:
 
         assert len(results) == 0
 
-    @pytest.mark.asyncio
     async def test_fetch_404_returns_empty(self, filters, greenhouse_board):
         """HTTP 404 should return empty list, not raise."""
         client = GreenhouseClient(filters)
@@ -281,7 +340,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_429_returns_empty(self, filters, greenhouse_board):
         """HTTP 429 rate limited should return empty list."""
         client = GreenhouseClient(filters)
@@ -299,7 +357,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_500_returns_empty(self, filters, greenhouse_board):
         """HTTP 500 server error should return empty list."""
         client = GreenhouseClient(filters)
@@ -317,7 +374,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_transport_error_returns_empty(self, filters, greenhouse_board):
         """Network transport errors should return empty list."""
         client = GreenhouseClient(filters)
@@ -331,7 +387,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_faang_plus_flag_propagated(self, filters, greenhouse_board_faang):
         """is_faang_plus from board config should propagate to RawListing."""
         mock_response = httpx.Response(
@@ -357,7 +412,6 @@ class TestGreenhouseClient:
         assert len(results) == 1
         assert results[0].is_faang_plus is True
 
-    @pytest.mark.asyncio
     async def test_empty_jobs_response(self, filters, greenhouse_board):
         """Empty jobs array should return empty list."""
         mock_response = httpx.Response(
@@ -372,7 +426,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_missing_url_skipped(self, filters, greenhouse_board):
         """Jobs without absolute_url should be skipped."""
         mock_response = httpx.Response(
@@ -396,7 +449,6 @@ class TestGreenhouseClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_extracts_description_from_content(self, filters, greenhouse_board):
         """Greenhouse content HTML is extracted as description."""
         mock_response = httpx.Response(
@@ -423,7 +475,6 @@ class TestGreenhouseClient:
         assert "intern" in results[0].description.lower()
         assert "<p>" not in results[0].description
 
-    @pytest.mark.asyncio
     async def test_empty_description_when_no_content(self, filters, greenhouse_board):
         """Description defaults to empty string when no content field."""
         mock_response = httpx.Response(
@@ -457,7 +508,6 @@ class TestGreenhouseClient:
 class TestLeverClient:
     """Tests for the Lever ATS client."""
 
-    @pytest.mark.asyncio
     async def test_fetch_200_with_matching_postings(self, filters, lever_board):
         """Matching intern postings are returned."""
         mock_response = httpx.Response(
@@ -485,7 +535,6 @@ class TestLeverClient:
         assert results[0].title == "Software Engineering Intern"
         assert results[0].source == "lever_api"
 
-    @pytest.mark.asyncio
     async def test_fetch_404_returns_empty(self, filters, lever_board):
         """HTTP 404 returns empty list."""
         client = LeverClient(filters)
@@ -503,7 +552,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_429_returns_empty(self, filters, lever_board):
         """HTTP 429 rate limited returns empty list."""
         client = LeverClient(filters)
@@ -521,7 +569,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_500_returns_empty(self, filters, lever_board):
         """HTTP 500 server error returns empty list."""
         client = LeverClient(filters)
@@ -539,7 +586,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_non_list_response_returns_empty(self, filters, lever_board):
         """Non-list response body should return empty list."""
         mock_response = httpx.Response(
@@ -554,7 +600,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_transport_error_returns_empty(self, filters, lever_board):
         """Transport errors return empty list."""
         client = LeverClient(filters)
@@ -568,7 +613,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_missing_hosted_url_skipped(self, filters, lever_board):
         """Postings without hostedUrl are skipped."""
         mock_response = httpx.Response(
@@ -589,7 +633,6 @@ class TestLeverClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_co_op_keyword_matches(self, filters, lever_board):
         """co-op keyword in title should match."""
         mock_response = httpx.Response(
@@ -611,7 +654,6 @@ class TestLeverClient:
         assert len(results) == 1
         assert results[0].title == "Software Engineering Co-Op"
 
-    @pytest.mark.asyncio
     async def test_extracts_description_plain(self, filters, lever_board):
         """Lever descriptionPlain is extracted as description."""
         mock_response = httpx.Response(
@@ -634,7 +676,6 @@ class TestLeverClient:
         assert len(results) == 1
         assert "intern" in results[0].description.lower()
 
-    @pytest.mark.asyncio
     async def test_falls_back_to_html_description(self, filters, lever_board):
         """Lever falls back to HTML description when descriptionPlain is missing."""
         mock_response = httpx.Response(
@@ -667,7 +708,6 @@ class TestLeverClient:
 class TestAshbyClient:
     """Tests for the Ashby GraphQL client."""
 
-    @pytest.mark.asyncio
     async def test_fetch_200_with_matching_jobs(self, filters, ashby_board):
         """Matching intern jobs from GraphQL response are returned."""
         mock_response = httpx.Response(
@@ -712,7 +752,6 @@ class TestAshbyClient:
         assert "testco" in results[0].url
         assert "job-1" in results[0].url
 
-    @pytest.mark.asyncio
     async def test_fetch_with_external_link(self, filters, ashby_board):
         """Jobs with externalLink should use that URL."""
         mock_response = httpx.Response(
@@ -746,7 +785,6 @@ class TestAshbyClient:
         assert len(results) == 1
         assert results[0].url == "https://external.com/apply/123"
 
-    @pytest.mark.asyncio
     async def test_fetch_404_returns_empty(self, filters, ashby_board):
         """HTTP 404 returns empty list."""
         client = AshbyClient(filters)
@@ -764,7 +802,6 @@ class TestAshbyClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_fetch_500_returns_empty(self, filters, ashby_board):
         """HTTP 500 returns empty list."""
         client = AshbyClient(filters)
@@ -782,7 +819,6 @@ class TestAshbyClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_multiple_teams(self, filters, ashby_board):
         """Jobs from multiple teams are aggregated."""
         mock_response = httpx.Response(
@@ -826,7 +862,6 @@ class TestAshbyClient:
 
         assert len(results) == 2
 
-    @pytest.mark.asyncio
     async def test_empty_teams(self, filters, ashby_board):
         """Empty teams array returns empty list."""
         mock_response = httpx.Response(
@@ -841,7 +876,6 @@ class TestAshbyClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_transport_error_returns_empty(self, filters, ashby_board):
         """Transport errors return empty list."""
         client = AshbyClient(filters)
@@ -855,7 +889,6 @@ class TestAshbyClient:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_extracts_description_plain(self, filters, ashby_board):
         """Ashby descriptionPlain is extracted as description."""
         mock_response = httpx.Response(
@@ -899,8 +932,7 @@ class TestAshbyClient:
 class TestGenericScraper:
     """Tests for the generic career page scraper."""
 
-    @pytest.mark.asyncio
-    async def test_scrape_finds_intern_links(self, scrape_source):
+    async def test_scrape_finds_intern_links(self, scraper, scrape_source):
         """Scraper should find anchor tags with intern keywords."""
         html = """
         <html><body>
@@ -910,13 +942,6 @@ class TestGenericScraper:
         </body></html>
         """
 
-        with patch.object(GenericScraper, "__init__", lambda self: None):
-            scraper = GenericScraper()
-            scraper._rate_limiter = MagicMock()
-            scraper._intern_keywords = ["intern", "internship"]
-            scraper._exclude_keywords = ["senior", "staff"]
-            scraper._config = MagicMock()
-
         with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=True), \
              patch.object(scraper, "_fetch_page", new_callable=AsyncMock, return_value=html), \
              patch("scripts.utils.scraper.asyncio.sleep", new_callable=AsyncMock):
@@ -929,27 +954,282 @@ class TestGenericScraper:
         assert any("Intern" in t for t in titles)
         assert all("Senior" not in t for t in titles)
 
-    @pytest.mark.asyncio
-    async def test_scrape_robots_blocked(self, scrape_source):
-        """Scraper should respect robots.txt denial."""
-        with patch.object(GenericScraper, "__init__", lambda self: None):
-            scraper = GenericScraper()
-            scraper._rate_limiter = MagicMock()
-            scraper._config = MagicMock()
+    async def test_scrape_keeps_noscript_links(self, scraper, scrape_source):
+        """Server-rendered job links inside <noscript> are still extracted."""
+        html = """
+        <html><body>
+            <script>renderJobs()</script>
+            <noscript><a href="/jobs/321">Data Science Intern</a></noscript>
+        </body></html>
+        """
+
+        with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=True), \
+             patch.object(scraper, "_fetch_page", new_callable=AsyncMock, return_value=html):
+            results = await scraper.scrape_career_page(scrape_source)
+
+        assert [r.title for r in results] == ["Data Science Intern"]
+
+    async def test_scrape_job_containers_and_locations(self, scraper, scrape_source):
+        """Job containers are matched by class and yield their location."""
+        html = """
+        <html><head><script>var intern = "Intern";</script></head><body>
+            <ul>
+                <li class="Job-Item">
+                    <a href="/jobs/1">SWE Intern</a>
+                    <span class="job-location">Atlanta, GA</span>
+                </li>
+                <li class="job-item">
+                    <a href="/jobs/2"></a><h3>Data Internship</h3>
+                    <div class="City">Remote</div>
+                </li>
+            </ul>
+        </body></html>
+        """
+
+        with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=True), \
+             patch.object(scraper, "_fetch_page", new_callable=AsyncMock, return_value=html), \
+             patch("scripts.utils.scraper.asyncio.sleep", new_callable=AsyncMock):
+            results = await scraper.scrape_career_page(scrape_source)
+
+        by_title = {r.title: r for r in results}
+        assert set(by_title) == {"SWE Intern", "Data Internship"}
+        assert by_title["SWE Intern"].location == "Atlanta, GA"
+        assert by_title["Data Internship"].location == "Remote"
+        assert by_title["Data Internship"].raw_data["container_text"] == "data internship remote"
+
+    @pytest.mark.parametrize(
+        "href",
+        ["https://other.com/a", "//cdn.com/a", "/jobs/1", "jobs/2", "?p=2", "#top", ""],
+    )
+    def test_resolve_href_matches_urljoin(self, href):
+        base_url = "https://scrapeinc.com/careers/list?q=1"
+        assert _resolve_href(href, base_url, urlsplit(base_url)) == urljoin(base_url, href)
+
+    @pytest.mark.parametrize(
+        "name, slug",
+        [("Acme Corp.", "acme-corp"), ("  AT&T  ", "at-t"), ("Näme", "n-me")],
+    )
+    def test_slugify(self, name, slug):
+        assert _slugify(name) == slug
+
+    def test_nearby_location_climbs_two_levels(self, scraper):
+        tree = LexborHTMLParser(
+            '<section><p class="Region">Far</p><div>'
+            '<span class="Job-Location">Atlanta, GA</span>'
+            '<h3><a href="/j/1">Intern</a></h3></div></section>'
+            '<section><p class="region">Far</p><div><ul><li>'
+            '<a href="/j/2">Intern</a></li></ul></div></section>'
+        )
+        near, far = tree.css("a")
+        assert scraper._extract_nearby_location(near) == "Atlanta, GA"
+        assert scraper._extract_nearby_location(far) == "Unknown"
+
+    def test_extract_listings_one_per_url(self, scraper, scrape_source):
+        """Anchors and their containers yield a single listing per URL."""
+        html = """
+        <html><body>
+            <div class="job-card">
+                <a href="/jobs/1">Apply</a>
+                <a href="/jobs/9">Share</a>
+                <p>Summer Intern, Atlanta, GA</p>
+            </div>
+            <a href="/jobs/1">Summer Intern</a>
+            <a href="https://scrapeinc.com/jobs/1">Summer Intern</a>
+        </body></html>
+        """
+
+        tree = LexborHTMLParser(html)
+        results = scraper._extract_listings(tree, scrape_source)
+
+        assert [r.url for r in results] == ["https://scrapeinc.com/jobs/1"]
+        assert results[0].title == "Apply"
+        assert results[0].location == "Atlanta, GA"
 
+    def test_nested_containers_use_outermost(self, scraper, scrape_source):
+        """A link that opens nested containers takes the outer one's text and location."""
+        html = """
+        <html><body>
+            <div class="job-listing">
+                <span class="location">Atlanta, GA</span>
+                <div class="job-card">
+                    <a href="/jobs/1">Apply</a>
+                    <span class="location">Remote</span>
+                    <p>Summer Intern</p>
+                </div>
+            </div>
+        </body></html>
+        """
+
+        results = scraper._extract_listings(LexborHTMLParser(html), scrape_source)
+
+        assert [r.url for r in results] == ["https://scrapeinc.com/jobs/1"]
+        assert results[0].location == "Atlanta, GA"
+        assert results[0].raw_data["container_text"].startswith("atlanta, ga")
+
+    def test_container_with_duplicate_first_link_is_skipped(self, scraper, scrape_source):
+        """A container whose first link was already emitted does not fall back to its next link."""
+        html = """
+        <html><body>
+            <a href="/jobs/1">Summer Intern</a>
+            <div class="job-card">
+                <a href="/jobs/1">Apply</a>
+                <a href="/jobs/2">Details</a>
+                <p>Summer Intern</p>
+            </div>
+        </body></html>
+        """
+
+        results = scraper._extract_listings(LexborHTMLParser(html), scrape_source)
+
+        assert [r.url for r in results] == ["https://scrapeinc.com/jobs/1"]
+
+    def test_excluded_first_link_still_stands_in_for_container(self, scraper, scrape_source):
+        """A first link rejected on its own href is still the container's only link."""
+        html = """
+        <html><body>
+            <div class="job-card">
+                <a href="/jobs/senior-track/1">Intern program</a>
+                <a href="/jobs/2">Details</a>
+                <p>Atlanta, GA</p>
+            </div>
+        </body></html>
+        """
+
+        results = scraper._extract_listings(LexborHTMLParser(html), scrape_source)
+
+        assert [r.url for r in results] == ["https://scrapeinc.com/jobs/senior-track/1"]
+        assert results[0].raw_data["container_text"].startswith("intern program")
+
+    async def test_requests_reuse_one_client(self, scraper_config):
+        """robots.txt and page fetches share one client, closed by aclose."""
+        response = httpx.Response(
+            200, text="<html></html>",
+            request=httpx.Request("GET", "https://example.com/careers"),
+        )
+        scraper = GenericScraper()
+
+        with patch("scripts.utils.scraper.httpx.AsyncClient") as mock_client_cls:
+            mock_client = mock_client_cls.return_value
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(return_value=response)
+            mock_client.aclose = AsyncMock()
+
+            async with scraper:
+                assert await scraper.check_robots_txt("https://example.com/careers")
+                await scraper._fetch_page("https://example.com/careers")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client.get.await_count == 2
+        mock_client.aclose.assert_awaited_once()
+
+    async def test_robots_txt_cached_per_origin(self, scraper_config):
+        """robots.txt is fetched once per origin until the TTL expires."""
+        fetched = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetched.append(str(request.url))
+            return httpx.Response(200, text="User-agent: *\nDisallow: /\n")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            scraper = GenericScraper(http=http)
+
+            with patch("scripts.utils.scraper.time.monotonic", return_value=100.0):
+                assert await scraper.check_robots_txt("https://a.com/jobs/1") is False
+                assert await scraper.check_robots_txt("https://a.com/jobs/2") is False
+            assert fetched == ["https://a.com/robots.txt"]
+
+            with patch(
+                "scripts.utils.scraper.time.monotonic", return_value=100.0 + ROBOTS_CACHE_TTL
+            ):
+                await scraper.check_robots_txt("https://a.com/jobs/3")
+            assert len(fetched) == 2
+
+    async def test_aclose_leaves_injected_client_open(self, scraper):
+        """An injected client is used as-is and not closed by the scraper."""
+        http = scraper._client()
+
+        await scraper.aclose()
+
+        assert scraper._client() is http
+        assert not http.is_closed
+
+    def test_keyword_matching(self, scraper):
+        """Include keywords match whole words; exclude keywords match substrings."""
+        assert scraper._matches_intern_keywords_lc("swe intern, summer")
+        assert scraper._matches_intern_keywords_lc("co-op program")
+        assert not scraper._matches_intern_keywords_lc("internal tools engineer")
+        assert scraper._matches_exclude_keywords_lc("seniority-based role")
+        assert not scraper._matches_exclude_keywords_lc("swe intern")
+
+        scraper._intern_pattern = _keyword_pattern((), True)
+        scraper._exclude_pattern = _keyword_pattern((), False)
+        assert not scraper._matches_intern_keywords_lc("intern")
+        assert not scraper._matches_exclude_keywords_lc("senior")
+
+    def test_container_location_falls_back_to_city_state(self, scraper):
+        """Without a location element, a "City, ST" run in the text is used."""
+        tree = LexborHTMLParser('<li class="job">intern in <b>San Jose, CA</b></li>')
+        container = tree.css_first("li")
+        assert scraper._extract_location_from_container(container) == "San Jose, CA"
+        # Text the caller already extracted is reused instead of re-read
+        assert (
+            scraper._extract_location_from_container(container, "based in Austin, TX")
+            == "Austin, TX"
+        )
+
+    async def test_scrape_all_bounds_concurrency(self, scraper):
+        """scrape_all caps in-flight pages and skips sources that raise."""
+        sources = [
+            ScrapeSource(company=f"Co{i}", url=f"https://co{i}.example/careers")
+            for i in range(5)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def fake_scrape(source):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if source.company == "Co3":
+                raise httpx.ConnectError("boom")
+            return [MagicMock(company=source.company)]
+
+        with patch.object(scraper, "scrape_career_page", side_effect=fake_scrape):
+            results = await scraper.scrape_all(sources, concurrency=2)
+
+        assert peak == 2
+        assert [r.company for r in results] == ["Co0", "Co1", "Co2", "Co4"]
+
+    async def test_rate_limiter_bursts_then_waits_with_jitter(self):
+        """A domain gets `capacity` immediate requests, then waits plus jitter."""
+        limiter = _DomainRateLimiter(max_per_second=2.0, capacity=2, max_jitter=0.5)
+
+        with patch("scripts.utils.scraper.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+             patch("scripts.utils.scraper.time.monotonic", return_value=100.0), \
+             patch("scripts.utils.scraper.random.uniform", return_value=0.25):
+            await limiter.wait("example.com")
+            await limiter.wait("example.com")
+            await limiter.wait("other.com")
+            mock_sleep.assert_not_awaited()
+
+            await limiter.wait("example.com")
+            assert mock_sleep.await_args.args[0] == pytest.approx(0.5 + 0.25)
+
+            # A second waiter queues behind the first
+            await limiter.wait("example.com")
+            assert mock_sleep.await_args.args[0] == pytest.approx(1.0 + 0.25)
+
+    async def test_scrape_robots_blocked(self, scraper, scrape_source):
+        """Scraper should respect robots.txt denial."""
         with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=False):
             results = await scraper.scrape_career_page(scrape_source)
 
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_scrape_fetch_failure(self, scrape_source):
+    async def test_scrape_fetch_failure(self, scraper, scrape_source):
         """Scraper should return empty list on fetch failure."""
-        with patch.object(GenericScraper, "__init__", lambda self: None):
-            scraper = GenericScraper()
-            scraper._rate_limiter = MagicMock()
-            scraper._config = MagicMock()
-
         with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=True), \
              patch.object(
                  scraper, "_fetch_page", new_callable=AsyncMock,
@@ -959,14 +1239,8 @@ class TestGenericScraper:
 
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_scrape_empty_page(self, scrape_source):
+    async def test_scrape_empty_page(self, scraper, scrape_source):
         """Empty page returns empty list."""
-        with patch.object(GenericScraper, "__init__", lambda self: None):
-            scraper = GenericScraper()
-            scraper._rate_limiter = MagicMock()
-            scraper._config = MagicMock()
-
         with patch.object(scraper, "check_robots_txt", new_callable=AsyncMock, return_value=True), \
              patch.object(scraper, "_fetch_page", new_callable=AsyncMock, return_value=""):
             results = await scraper.scrape_career_page(scrape_source)
@@ -1044,6 +1318,37 @@ class TestMarkdownParsing:
         """Combined markdown formatting is stripped."""
         assert _strip_markup("**[Google](https://google.com)**") == "Google"
 
+    def test_strip_markup_link_with_bold_text_and_tags(self):
+        """Nested markup inside a link and HTML tags are all removed."""
+        assert _strip_markup("[**Ramp**](https://ramp.com) <b>NYC</b> 🔥") == "Ramp NYC"
+
+    @pytest.mark.parametrize(
+        "cell, expected",
+        [("  Acme Corp  ", "Acme Corp"), ("↳", ""), (" ↳ Acme", "Acme"), ("🚀 Café ☕", "Café")],
+    )
+    def test_strip_markup_ascii_and_unicode_cells(self, cell, expected):
+        assert _strip_markup(cell) == expected
+
+    def test_parse_skips_aligned_separator_and_linked_header(self):
+        """Alignment separators and header rows are rejected even with links in them."""
+        content = (
+            "| Company | Role | Location | [Link](https://example.com/legend) |\n"
+            "| :--- | :---: | ---: | - |\n"
+            "| Acme | SWE Intern | Atlanta, GA | [Apply](https://acme.com/1) |\n"
+        )
+        rows = _parse_readme_table(content, "test/repo")
+        assert [(r["company"], r["url"]) for r in rows] == [("Acme", "https://acme.com/1")]
+
+    def test_parse_crlf_table(self):
+        """Tables with Windows line endings are parsed."""
+        content = (
+            "| Company | Role | Location | Link |\r\n"
+            "|---------|------|----------|------|\r\n"
+            "| **Meta** | Intern | Menlo Park | [Apply](https://metacareers.com/job/1) |\r\n"
+        )
+        rows = _parse_readme_table(content, "test/repo")
+        assert [r["company"] for r in rows] == ["Meta"]
+
 
 # ======================================================================
 # HTML table parsing (Simplify format)
@@ -1214,7 +1519,6 @@ class TestHTMLTableParsing:
 class TestGitHubMonitor:
     """Tests for the GitHub repo monitor."""
 
-    @pytest.mark.asyncio
     async def test_monitor_new_entries(self, github_monitor):
         """New entries from a monitored repo are returned."""
         readme_content = """
@@ -1230,17 +1534,10 @@ class TestGitHubMonitor:
         )
 
         # Patch state to have no previous entries
-        with patch("scripts.utils.scraper.httpx.AsyncClient") as mock_client_cls, \
-             patch("scripts.utils.scraper._load_monitor_state", return_value=set()), \
+        with patch("scripts.utils.scraper._load_monitor_state", return_value={"urls": set(), "etag": None, "content_hash": None}), \
              patch("scripts.utils.scraper._save_monitor_state"):
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            results = await monitor_github_repo(github_monitor)
+            async with _transport_client(mock_response) as http:
+                results = await monitor_github_repo(github_monitor, http=http)
 
         assert len(results) == 2
         companies = {r.company for r in results}
@@ -1248,7 +1545,6 @@ class TestGitHubMonitor:
         assert "Ramp" in companies
         assert all(r.source == "github_monitor" for r in results)
 
-    @pytest.mark.asyncio
     async def test_monitor_only_new_entries(self, github_monitor):
         """Only entries not previously seen are returned."""
         readme_content = """
@@ -1264,23 +1560,85 @@ class TestGitHubMonitor:
         )
 
         # Previous state already has Stripe
-        with patch("scripts.utils.scraper.httpx.AsyncClient") as mock_client_cls, \
-             patch("scripts.utils.scraper._load_monitor_state", return_value={"https://stripe.com/jobs/1"}), \
+        with patch(
+                 "scripts.utils.scraper._load_monitor_state",
+                 return_value={"urls": {"https://stripe.com/jobs/1"}, "etag": None, "content_hash": None},
+             ), \
              patch("scripts.utils.scraper._save_monitor_state"):
-
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value = mock_client
-
-            results = await monitor_github_repo(github_monitor)
+            async with _transport_client(mock_response) as http:
+                results = await monitor_github_repo(github_monitor, http=http)
 
         # Only Ramp should be new
         assert len(results) == 1
         assert results[0].company == "Ramp"
 
-    @pytest.mark.asyncio
+    async def test_monitor_sends_etag_and_skips_on_304(self, github_monitor):
+        """A saved ETag is sent back; a 304 returns nothing and keeps state."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=httpx.Response(304))
+
+        with patch(
+                 "scripts.utils.scraper._load_monitor_state",
+                 return_value={"urls": {"https://stripe.com/jobs/1"}, "etag": '"v1"', "content_hash": None},
+             ), \
+             patch("scripts.utils.scraper._parse_readme_table") as mock_parse, \
+             patch("scripts.utils.scraper._save_monitor_state") as mock_save:
+            results = await monitor_github_repo(github_monitor, http=mock_client)
+
+        assert results == []
+        assert mock_client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        mock_parse.assert_not_called()
+        mock_save.assert_not_called()
+
+    async def test_monitor_saves_response_etag(self, github_monitor):
+        """The README's ETag is stored with the new URL set."""
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                text="| Company | Role |\n|---|---|\n",
+                headers={"ETag": '"v2"'},
+                request=httpx.Request("GET", "https://raw.githubusercontent.com/test/test"),
+            )
+        )
+
+        with patch(
+                 "scripts.utils.scraper._load_monitor_state",
+                 return_value={"urls": set(), "etag": None, "content_hash": None},
+             ), \
+             patch("scripts.utils.scraper._save_monitor_state") as mock_save:
+            await monitor_github_repo(github_monitor, http=mock_client)
+
+        assert mock_client.get.await_args.kwargs["headers"] is None
+        assert mock_save.call_args.args[3] == '"v2"'
+
+    async def test_monitor_skips_parse_for_identical_readme(self, github_monitor):
+        """An unchanged README body is not re-parsed; only last_checked is refreshed."""
+        import hashlib
+
+        body = "| Company | Role |\n|---|---|\n"
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                text=body,
+                request=httpx.Request("GET", "https://raw.githubusercontent.com/test/test"),
+            )
+        )
+
+        with patch(
+                 "scripts.utils.scraper._load_monitor_state",
+                 return_value={"urls": {"https://a.com"}, "etag": None, "content_hash": digest},
+             ), \
+             patch("scripts.utils.scraper._parse_readme_table") as mock_parse, \
+             patch("scripts.utils.scraper._save_monitor_state") as mock_save:
+            results = await monitor_github_repo(github_monitor, http=mock_client)
+
+        assert results == []
+        mock_parse.assert_not_called()
+        assert mock_save.call_args.args[2:] == ({"https://a.com"}, None, digest)
+
     async def test_monitor_http_error(self, github_monitor):
         """HTTP errors return empty list."""
         mock_response = httpx.Response(
@@ -1288,39 +1646,178 @@ class TestGitHubMonitor:
             request=httpx.Request("GET", "https://raw.githubusercontent.com/test/test"),
         )
 
-        with patch("scripts.utils.scraper.httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_response.raise_for_status = MagicMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Not Found",
-                    request=mock_response.request,
-                    response=mock_response,
-                )
+        async with _transport_client(mock_response) as http:
+            results = await monitor_github_repo(github_monitor, http=http)
+
+        assert results == []
+
+    async def test_monitor_all_loads_and_saves_state_once(self):
+        """monitor_all reads each repo's state once and writes only changed ones."""
+        from scripts.utils.scraper import monitor_all
+
+        monitors = [
+            GitHubMonitor(repo="a/changed", branch="main", file="README.md"),
+            GitHubMonitor(repo="b/unchanged", branch="main", file="README.md"),
+            GitHubMonitor(repo="c/broken", branch="main", file="README.md"),
+        ]
+        body = "| Company | Role | Link |\n|---|---|---|\n| Acme | SWE Intern | [Apply](https://acme.com/1) |\n"
+
+        async def fake_get(url, headers=None):
+            if "b/unchanged" in url:
+                return httpx.Response(304)
+            if "c/broken" in url:
+                raise httpx.ConnectError("down")
+            return httpx.Response(
+                200, text=body, request=httpx.Request("GET", url)
             )
-            mock_client_cls.return_value = mock_client
 
-            results = await monitor_github_repo(github_monitor)
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=fake_get)
+        empty = {"urls": set(), "etag": '"e"', "content_hash": None}
 
-        assert results == []
+        with patch("scripts.utils.scraper._load_monitor_state", side_effect=lambda d, r: dict(empty)) as mock_load, \
+             patch("scripts.utils.scraper._save_monitor_state") as mock_save:
+            results = await monitor_all(monitors, http=mock_client)
+
+        assert [r.url for r in results] == ["https://acme.com/1"]
+        assert mock_load.call_count == 3
+        mock_save.assert_called_once()
+        assert mock_save.call_args.args[1:3] == ("a/changed", {"https://acme.com/1"})
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_monitor_state_round_trip(self, tmp_path, use_orjson):
+        """Each repo's URLs are saved to and loaded from its own file."""
+        from scripts.utils import scraper
+
+        state_dir = tmp_path / "monitor_state"
+        with patch.object(scraper, "orjson", scraper.orjson if use_orjson else None):
+            scraper._save_monitor_state(
+                state_dir, "test/repo", {"https://b.com", "https://a.com"}, '"abc"', "h1"
+            )
+            scraper._save_monitor_state(state_dir, "other/repo", {"https://c.com"})
+            loaded = scraper._load_monitor_state(state_dir, "test/repo")
+
+        assert loaded == {
+            "urls": {"https://a.com", "https://b.com"},
+            "etag": '"abc"',
+            "content_hash": "h1",
+        }
+        assert sorted(p.name for p in state_dir.iterdir()) == ["other_repo.json", "test_repo.json"]
+        saved = json.loads((state_dir / "test_repo.json").read_text())
+        assert saved["urls"] == ["https://a.com", "https://b.com"]
+        assert "last_checked" in saved
+
+    def test_monitor_state_falls_back_to_legacy_file(self, tmp_path):
+        """Repos without a state file yet read their entry from monitor_state.json."""
+        from scripts.utils.scraper import _load_monitor_state
+
+        state_dir = tmp_path / "monitor_state"
+        (tmp_path / "monitor_state.json").write_text(
+            json.dumps({"test/repo": {"urls": ["https://a.com"]}})
+        )
+
+        assert _load_monitor_state(state_dir, "test/repo")["urls"] == {"https://a.com"}
+        assert _load_monitor_state(state_dir, "other/repo") == {"urls": set(), "etag": None, "content_hash": None}
+
+    def test_monitor_state_corrupt_file_is_empty(self, tmp_path):
+        """A corrupt state file loads as no previously seen URLs."""
+        from scripts.utils.scraper import _load_monitor_state
+
+        (tmp_path / "test_repo.json").write_text("{not json")
+        assert _load_monitor_state(tmp_path, "test/repo") == {"urls": set(), "etag": None, "content_hash": None}
 
-    @pytest.mark.asyncio
     async def test_monitor_network_error(self, github_monitor):
         """Network errors return empty list."""
-        with patch("scripts.utils.scraper.httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-            mock_client_cls.return_value = mock_client
-
-            results = await monitor_github_repo(github_monitor)
+        async with _transport_client(httpx.TimeoutException("Timeout")) as http:
+            results = await monitor_github_repo(github_monitor, http=http)
 
         assert results == []
 
 
+# ======================================================================
+# gather_ats_results()
+# ======================================================================
+
+
+class TestGatherAtsResults:
+    """Tests for the per-board fan-out helper."""
+
+    async def test_returns_source_order_and_isolates_failures(
+        self, greenhouse_board, greenhouse_board_faang
+    ):
+        """Listings come back in board order even when a later board finishes first."""
+        from scripts.discover import gather_ats_results
+
+        def listing(n):
+            return RawListing(
+                company="BigCo", company_slug="bigco", title="Intern",
+                location="NYC", url=f"https://bigco.com/{n}", source="greenhouse_api",
+            )
+
+        failing = GreenhouseBoard(token="broken", company="Broken")
+
+        async def fetch(board):
+            if board is failing:
+                raise httpx.ConnectError("down")
+            if board is greenhouse_board:
+                await asyncio.sleep(0.01)
+                return [listing(1)]
+            return [listing(2)]
+
+        client = MagicMock()
+        client.fetch_listings = fetch
+
+        results = await gather_ats_results(
+            client, [greenhouse_board, failing, greenhouse_board_faang], "Greenhouse",
+        )
+
+        assert [r.url for r in results] == ["https://bigco.com/1", "https://bigco.com/2"]
+
+    async def test_unexpected_errors_propagate(self, greenhouse_board):
+        """A bug in a fetcher is raised rather than logged as a failed board."""
+        from scripts.discover import gather_ats_results
+
+        async def fetch(board):
+            raise AttributeError("bug")
+
+        client = MagicMock()
+        client.fetch_listings = fetch
+
+        with pytest.raises(AttributeError):
+            await gather_ats_results(client, [greenhouse_board], "Greenhouse")
+
+    async def test_respects_max_concurrent(self):
+        """No more than max_concurrent boards are fetched at the same time."""
+        import asyncio
+
+        from scripts.discover import gather_ats_results
+
+        in_flight = 0
+        peak = 0
+
+        async def fetch(board):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        client = MagicMock()
+        client.fetch_listings = fetch
+        boards = [GreenhouseBoard(token=f"t{i}", company=f"C{i}") for i in range(6)]
+
+        await gather_ats_results(client, boards, "Greenhouse", max_concurrent=2)
+
+        assert peak == 2
+
+    async def test_no_boards_returns_empty(self):
+        """An empty board list short-circuits to an empty result."""
+        from scripts.discover import gather_ats_results
+
+        assert await gather_ats_results(MagicMock(), [], "Greenhouse") == []
+
+
 # ======================================================================
 # discover_all() orchestrator
 # ======================================================================
@@ -1329,7 +1826,6 @@ class TestGitHubMonitor:
 class TestDiscoverAll:
     """Tests for the main discover_all orchestrator."""
 
-    @pytest.mark.asyncio
     async def test_aggregates_results_from_all_sources(self):
         """discover_all combines results from all source types."""
         greenhouse_listings = [
@@ -1357,6 +1853,8 @@ class TestDiscoverAll:
              patch("scripts.discover._run_greenhouse", new_callable=AsyncMock, return_value=greenhouse_listings), \
              patch("scripts.discover._run_lever", new_callable=AsyncMock, return_value=lever_listings), \
              patch("scripts.discover._run_ashby", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_workday", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_smartrecruiters", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_scraping", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_github_monitors", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._save_raw_results"):
@@ -1371,7 +1869,6 @@ class TestDiscoverAll:
         assert "Stripe" in companies
         assert "Netflix" in companies
 
-    @pytest.mark.asyncio
     async def test_isolates_source_failures(self):
         """Failure in one source category does not affect others."""
         good_listings = [
@@ -1386,9 +1883,11 @@ class TestDiscoverAll:
         ]
 
         with patch("scripts.discover.load_config") as mock_config, \
-             patch("scripts.discover._run_greenhouse", new_callable=AsyncMock, side_effect=Exception("Greenhouse crashed")), \
+             patch("scripts.discover._run_greenhouse", new_callable=AsyncMock, side_effect=httpx.ConnectError("Greenhouse down")), \
              patch("scripts.discover._run_lever", new_callable=AsyncMock, return_value=good_listings), \
-             patch("scripts.discover._run_ashby", new_callable=AsyncMock, side_effect=Exception("Ashby crashed")), \
+             patch("scripts.discover._run_ashby", new_callable=AsyncMock, side_effect=ValueError("Ashby returned bad JSON")), \
+             patch("scripts.discover._run_workday", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_smartrecruiters", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_scraping", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_github_monitors", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._save_raw_results"):
@@ -1402,13 +1901,14 @@ class TestDiscoverAll:
         assert len(results) == 1
         assert results[0].company == "OK Corp"
 
-    @pytest.mark.asyncio
     async def test_no_listings_discovered(self):
         """When no sources return results, returns empty list."""
         with patch("scripts.discover.load_config") as mock_config, \
              patch("scripts.discover._run_greenhouse", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_lever", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_ashby", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_workday", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_smartrecruiters", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_scraping", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_github_monitors", new_callable=AsyncMock, return_value=[]):
 
@@ -1419,7 +1919,6 @@ class TestDiscoverAll:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_save_raw_results_called(self):
         """_save_raw_results is called when listings are found."""
         listings = [
@@ -1437,6 +1936,8 @@ class TestDiscoverAll:
              patch("scripts.discover._run_greenhouse", new_callable=AsyncMock, return_value=listings), \
              patch("scripts.discover._run_lever", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_ashby", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_workday", new_callable=AsyncMock, return_value=[]), \
+             patch("scripts.discover._run_smartrecruiters", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_scraping", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._run_github_monitors", new_callable=AsyncMock, return_value=[]), \
              patch("scripts.discover._save_raw_results") as mock_save:
@@ -1450,6 +1951,27 @@ class TestDiscoverAll:
         saved_listings = mock_save.call_args[0][0]
         assert len(saved_listings) == 1
 
+    async def test_sources_share_one_client(self):
+        """Every source category receives the same client, closed afterwards."""
+        runners = [
+            "_run_greenhouse", "_run_lever", "_run_ashby", "_run_workday",
+            "_run_smartrecruiters", "_run_scraping", "_run_github_monitors",
+        ]
+        mocks = {name: AsyncMock(return_value=[]) for name in runners}
+
+        with patch("scripts.discover.load_config") as mock_config, \
+             patch.multiple("scripts.discover", **mocks):
+            mock_config.return_value = MagicMock(total_sources=5)
+
+            from scripts.discover import discover_all
+            await discover_all()
+
+        clients = {id(mock.call_args[0][1]) for mock in mocks.values()}
+        assert len(clients) == 1
+        http = mocks["_run_greenhouse"].call_args[0][1]
+        assert isinstance(http, httpx.AsyncClient)
+        assert http.is_closed
+
 
 class TestSaveRawResults:
     """Tests for the _save_raw_results helper."""
@@ -1478,6 +2000,65 @@ class TestSaveRawResults:
         assert len(data["listings"]) == 1
         assert data["listings"][0]["company"] == "Test"
 
+    def test_streams_multiple_listings(self, tmp_path):
+        """Listings written one at a time still form a single JSON document."""
+        from scripts.discover import _save_raw_results
+
+        listings = [
+            RawListing(
+                company=f"Co{i}",
+                company_slug=f"co{i}",
+                title="Intern",
+                location="Remote",
+                url=f"https://co{i}.example/jobs",
+                source="lever_api",
+            )
+            for i in range(3)
+        ]
+
+        with patch("scripts.discover.DATA_DIR", tmp_path):
+            output_path = _save_raw_results(listings)
+
+        data = json.loads(output_path.read_text())
+        assert data["total_count"] == 3
+        assert [item["company"] for item in data["listings"]] == ["Co0", "Co1", "Co2"]
+        assert "discovered_at" in data
+
+    def test_matches_model_dump(self, tmp_path):
+        """Saved listings round-trip to the same data as model_dump(mode="json")."""
+        from scripts.discover import _save_raw_results
+
+        listings = [
+            RawListing(
+                company="Café Corp",
+                company_slug="cafe-corp",
+                title="Intern",
+                location="Montréal, QC",
+                url="https://cafe.example/1",
+                source="greenhouse_api",
+            ),
+        ]
+
+        with patch("scripts.discover.DATA_DIR", tmp_path):
+            output_path = _save_raw_results(listings)
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["total_count"] == 1
+        assert data["listings"] == [listings[0].model_dump(mode="json")]
+
+    def test_filename_matches_discovered_at(self, tmp_path):
+        """The filename timestamp and discovered_at come from the same instant."""
+        from datetime import datetime
+
+        from scripts.discover import _save_raw_results
+
+        with patch("scripts.discover.DATA_DIR", tmp_path):
+            output_path = _save_raw_results([])
+
+        data = json.loads(output_path.read_text())
+        discovered_at = datetime.fromisoformat(data["discovered_at"])
+        assert output_path.name == f"raw_discovery_{discovered_at:%Y%m%dT%H%M%SZ}.json"
+
     def test_saves_empty_list(self, tmp_path):
         """Empty listings save as valid JSON with 0 count."""
         from scripts.discover import _save_raw_results
@@ -2,20 +2,28 @@
 
 Tests cover:
 - fetch_issues: success, empty result, HTTP error, no token, non-200 status
+- ETag caching: If-None-Match sent, 304 served from cache
 - comment_on_issue: success, HTTP error, non-201 status
 - close_issue: success, HTTP error, non-200 status
-- get_file_content: success with base64 decode, file not found, HTTP error
+- get_file_content: raw media type, file not found, HTTP error
 - _build_headers: with token, without token, from environment
+- shared client: reused across calls, closed by aclose, bypassed by ``http=``
+- retries: 429/5xx retried with Retry-After, give up after three attempts
+- request errors: transport/unexpected errors return each helper's falsy value
 """
 
-import base64
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import patch
 
 import httpx
 import pytest
 
+from scripts.utils import github_utils, http_cache
 from scripts.utils.github_utils import (
     _build_headers,
+    aclose,
     close_issue,
     comment_on_issue,
     fetch_issues,
@@ -23,44 +31,102 @@ from scripts.utils.github_utils import (
 )
 
 
-def _mock_async_client(**method_returns):
-    """Build a mock httpx.AsyncClient usable as an async context manager.
+@pytest.fixture(autouse=True)
+def _reset_shared_client(monkeypatch):
+    """Ensure each test builds its own shared client from the patched class."""
+    monkeypatch.setattr(github_utils, "_client", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(monkeypatch, tmp_path):
+    """Point the ETag cache at a per-test directory."""
+    monkeypatch.setattr(http_cache, "_CACHE_DIR", tmp_path / "http_cache")
+
+
+class _Call(NamedTuple):
+    """Positional and keyword arguments of one recorded call."""
+
+    args: tuple
+    kwargs: dict
+
+
+class _FakeAsyncClient:
+    """Hand-written httpx.AsyncClient stand-in with prewired responses.
+
+    Each keyword maps a method name (``get``, ``post``, ``patch``) to a
+    response, an exception to raise, or a list of those to hand out in
+    turn. Calls are recorded in ``get_calls``/``post_calls``/``patch_calls``.
+    """
+
+    def __init__(self, **returns):
+        self.headers = httpx.Headers()
+        self._returns = {
+            name: list(value) if isinstance(value, list) else value
+            for name, value in returns.items()
+        }
+        self.get_calls: list[_Call] = []
+        self.post_calls: list[_Call] = []
+        self.patch_calls: list[_Call] = []
+        self.aclose_calls = 0
+        self.is_closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def _respond(self, method, args, kwargs):
+        getattr(self, f"{method}_calls").append(_Call(args, kwargs))
+        value = self._returns[method]
+        if isinstance(value, list):
+            value = value.pop(0)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    async def get(self, *args, **kwargs):
+        return self._respond("get", args, kwargs)
+
+    async def post(self, *args, **kwargs):
+        return self._respond("post", args, kwargs)
+
+    async def patch(self, *args, **kwargs):
+        return self._respond("patch", args, kwargs)
+
+    async def aclose(self):
+        self.aclose_calls += 1
+
+
+def _fake_async_client(**method_returns):
+    """Build a fake httpx.AsyncClient constructor.
 
     Args:
-        **method_returns: Mapping of method name to mock response, e.g.
-            get=mock_response.  Use get=Exception("boom") for side effects.
+        **method_returns: Mapping of method name to response, e.g.
+            get=response.  Use get=Exception("boom") to raise, or a list to
+            return several values in order.
 
     Returns:
-        A MagicMock that, when called (i.e. ``httpx.AsyncClient(...)``),
-        returns an async context manager whose ``__aenter__`` yields a
-        mock client with the requested methods.
+        Tuple of (constructor, client). Calling the constructor (i.e.
+        ``httpx.AsyncClient(...)``) records the call in
+        ``constructor.calls`` and returns the client.
     """
-    client_instance = MagicMock()
-
-    for method_name, value in method_returns.items():
-        mock_method = AsyncMock()
-        if isinstance(value, Exception):
-            mock_method.side_effect = value
-        else:
-            mock_method.return_value = value
-        setattr(client_instance, method_name, mock_method)
+    client = _FakeAsyncClient(**method_returns)
+    calls: list[_Call] = []
 
-    # Make the constructor return an async context manager
-    cm = MagicMock()
-    cm.__aenter__ = AsyncMock(return_value=client_instance)
-    cm.__aexit__ = AsyncMock(return_value=False)
+    def constructor(*args, **kwargs):
+        calls.append(_Call(args, kwargs))
+        return client
 
-    constructor = MagicMock(return_value=cm)
-    return constructor, client_instance
+    constructor.calls = calls
+    return constructor, client
 
 
 def _mock_response(status_code: int, json_data=None):
-    """Build a mock httpx response."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    if json_data is not None:
-        resp.json.return_value = json_data
-    return resp
+    """Build a real httpx response with an optional JSON body."""
+    if json_data is None:
+        return httpx.Response(status_code)
+    return httpx.Response(status_code, json=json_data)
 
 
 # ======================================================================
@@ -95,103 +161,265 @@ class TestBuildHeaders:
         headers = _build_headers(token="ghp_test")
         assert "User-Agent" in headers
 
+    def test_explicit_token_skips_secret_lookup(self):
+        """An explicit token never touches the secret store."""
+        with patch("scripts.utils.github_utils.get_secret") as mock_secret:
+            _build_headers(token="ghp_test")
+        mock_secret.assert_not_called()
+
+    def test_headers_cached_per_token(self):
+        """Repeated calls with the same token reuse one headers dict."""
+        assert _build_headers(token="ghp_a") is _build_headers(token="ghp_a")
+        assert _build_headers(token="ghp_a") is not _build_headers(token="ghp_b")
+
 
 # ======================================================================
-# fetch_issues
+# Shared client
 # ======================================================================
 
 
-class TestFetchIssues:
-    """Tests for fetch_issues."""
+class TestSharedClient:
+    """Tests for the module-level shared AsyncClient."""
 
-    @pytest.mark.asyncio
-    async def test_success_returns_issues(self):
-        """A 200 response returns the list of issue dicts."""
-        mock_issues = [
-            {"number": 1, "title": "Test issue", "body": "body"},
-            {"number": 2, "title": "Another", "body": "body2"},
-        ]
-        resp = _mock_response(200, mock_issues)
-        constructor, client = _mock_async_client(get=resp)
+    async def test_client_reused_across_calls(self):
+        """Multiple API calls construct the client only once."""
+        constructor, client = _fake_async_client(
+            get=_mock_response(200, []), post=_mock_response(201)
+        )
 
         with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await fetch_issues("owner/repo", token="ghp_test")
+            await fetch_issues("owner/repo", token="ghp_test")
+            await comment_on_issue("owner/repo", 1, "Hi", token="ghp_test")
 
-        assert result == mock_issues
-        client.get.assert_called_once()
+        assert len(constructor.calls) == 1
+        assert constructor.calls[0].kwargs["base_url"] == "https://api.github.com"
+        assert constructor.calls[0].kwargs["http2"] is True
 
-    @pytest.mark.asyncio
-    async def test_empty_result(self):
-        """A 200 with empty list returns empty list."""
-        resp = _mock_response(200, [])
-        constructor, client = _mock_async_client(get=resp)
+    async def test_aclose_closes_and_resets(self):
+        """aclose closes the shared client so the next call builds a new one."""
+        constructor, client = _fake_async_client(get=_mock_response(200, []))
 
         with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await fetch_issues("owner/repo", token="ghp_test")
+            await fetch_issues("owner/repo", token="ghp_test")
+            await aclose()
+            assert client.aclose_calls == 1
+            assert github_utils._client is None
 
-        assert result == []
+            await fetch_issues("owner/repo", token="ghp_test")
 
-    @pytest.mark.asyncio
-    async def test_http_404_returns_empty(self):
-        """A 404 response returns empty list."""
-        resp = _mock_response(404, {"message": "Not Found"})
-        constructor, client = _mock_async_client(get=resp)
+        assert len(constructor.calls) == 2
+
+    async def test_injected_client_bypasses_shared_one(self):
+        """Passing ``http`` sends on that client and never builds the shared one."""
+        constructor, _ = _fake_async_client()
+        client = _FakeAsyncClient(get=_mock_response(200, []))
 
         with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await fetch_issues("owner/repo", token="ghp_test")
+            await fetch_issues("owner/repo", token="ghp_test", http=client)
+
+        assert len(client.get_calls) == 1
+        assert constructor.calls == []
+        assert github_utils._client is None
+
+    async def test_aclose_without_client_is_noop(self):
+        """aclose is safe to call when no client was ever created."""
+        await aclose()
+        assert github_utils._client is None
 
-        assert result == []
 
-    @pytest.mark.asyncio
-    async def test_http_error_returns_empty(self):
-        """An httpx.HTTPError returns empty list."""
-        constructor, client = _mock_async_client(
-            get=httpx.ConnectError("Connection refused")
+# ======================================================================
+# Retries
+# ======================================================================
+
+
+class TestRetries:
+    """Tests for retrying 429/5xx responses in _gh_request."""
+
+    async def test_server_error_retried_then_succeeds(self):
+        """A transient 503 is retried and the later success is returned."""
+        client = _FakeAsyncClient(get=[
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            _mock_response(200, [{"number": 1}]),
+        ])
+
+        result = await fetch_issues("owner/repo", token="ghp_test", http=client)
+
+        assert result == [{"number": 1}]
+        assert len(client.get_calls) == 2
+
+    async def test_gives_up_after_three_attempts(self):
+        """Persistent rate limiting returns a falsy result after three tries."""
+        client = _FakeAsyncClient(
+            post=httpx.Response(429, headers={"Retry-After": "0"})
         )
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await fetch_issues("owner/repo", token="ghp_test")
+        result = await comment_on_issue("owner/repo", 1, "Hi", token="ghp_test", http=client)
 
-        assert result == []
+        assert result is False
+        assert len(client.post_calls) == 3
 
-    @pytest.mark.asyncio
-    async def test_unexpected_error_returns_empty(self):
-        """An unexpected exception returns empty list."""
-        constructor, client = _mock_async_client(get=RuntimeError("boom"))
+    async def test_client_error_not_retried(self):
+        """A 4xx other than 429 is returned without retrying."""
+        client = _FakeAsyncClient(patch=_mock_response(422))
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await fetch_issues("owner/repo", token="ghp_test")
+        result = await close_issue("owner/repo", 1, token="ghp_test", http=client)
 
-        assert result == []
+        assert result is False
+        assert len(client.patch_calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_custom_label(self):
-        """Custom label is passed to the API."""
-        resp = _mock_response(200, [])
-        constructor, client = _mock_async_client(get=resp)
+    def test_retry_after_is_capped(self):
+        """Retry-After is honored but capped at MAX_RETRY_AFTER."""
+        exc = github_utils._RetryableResponse(
+            httpx.Response(429, headers={"Retry-After": "3600"})
+        )
+        state = SimpleNamespace(outcome=SimpleNamespace(exception=lambda: exc))
+        assert github_utils._retry_wait(state) == github_utils.MAX_RETRY_AFTER
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            await fetch_issues("owner/repo", label="custom-label", token="ghp_test")
 
-        call_kwargs = client.get.call_args
-        params = call_kwargs.kwargs.get("params") or call_kwargs[1].get("params")
-        assert params["labels"] == "custom-label"
+# ======================================================================
+# fetch_issues
+# ======================================================================
+
+
+class TestFetchIssues:
+    """Tests for fetch_issues."""
+
+    async def test_fetch_issues_matrix(self):
+        """Success, empty, 404, error and custom-label cases, fetched concurrently."""
+        issues = [
+            {"number": 1, "title": "Test issue", "body": "body"},
+            {"number": 2, "title": "Another", "body": "body2"},
+        ]
+        labels_seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            repo = request.url.path.removeprefix("/repos/").removesuffix("/issues")
+            labels_seen[repo] = request.url.params["labels"]
+            if repo == "owner/down":
+                raise httpx.ConnectError("fail", request=request)
+            if repo == "owner/broken":
+                raise RuntimeError("boom")
+            if repo == "owner/missing":
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json=issues if repo == "owner/repo" else [])
+
+        cases = {
+            "owner/repo": ({}, issues),
+            "owner/empty": ({}, []),
+            "owner/missing": ({}, []),
+            "owner/down": ({}, []),
+            "owner/broken": ({}, []),
+            "owner/labeled": ({"label": "custom-label"}, []),
+        }
+
+        async with httpx.AsyncClient(
+            base_url=github_utils.GITHUB_API_BASE,
+            transport=httpx.MockTransport(handler),
+        ) as http:
+            results = await asyncio.gather(*(
+                fetch_issues(repo, token="ghp_test", http=http, **kwargs)
+                for repo, (kwargs, _) in cases.items()
+            ))
+
+        assert results == [expected for _, expected in cases.values()]
+        assert labels_seen["owner/labeled"] == "custom-label"
+        assert labels_seen["owner/repo"] == "new-internship"
+
+    async def test_success_without_orjson(self):
+        """The stdlib json fallback decodes the same body."""
+        mock_issues = [{"number": 1, "title": "Test issue", "body": "body"}]
+        client = _FakeAsyncClient(get=_mock_response(200, mock_issues))
+
+        with patch("scripts.utils.github_utils.orjson", None):
+            result = await fetch_issues("owner/repo", token="ghp_test", http=client)
+
+        assert result == mock_issues
 
-    @pytest.mark.asyncio
     async def test_no_token_still_works(self):
         """When no token is provided, the function still makes the request."""
         resp = _mock_response(200, [])
-        constructor, client = _mock_async_client(get=resp)
+        client = _FakeAsyncClient(get=resp)
 
-        with (
-            patch("scripts.utils.github_utils.httpx.AsyncClient", constructor),
-            patch("scripts.utils.github_utils.get_secret", return_value=None),
-        ):
-            result = await fetch_issues("owner/repo")
+        with patch("scripts.utils.github_utils.get_secret", return_value=None):
+            result = await fetch_issues("owner/repo", http=client)
 
         assert result == []
 
 
+# ======================================================================
+# ETag caching
+# ======================================================================
+
+
+class TestETagCaching:
+    """Tests for conditional requests in fetch_issues and get_file_content."""
+
+    async def test_etag_stored_then_sent(self):
+        """A 200 with an ETag is cached and the next call sends If-None-Match."""
+        issues = [{"number": 1, "title": "T", "body": "b"}]
+        first = httpx.Response(200, json=issues, headers={"ETag": 'W/"abc"'})
+        client = _FakeAsyncClient(get=[first, httpx.Response(304)])
+
+        await fetch_issues("owner/repo", token="ghp_test", http=client)
+        result = await fetch_issues("owner/repo", token="ghp_test", http=client)
+
+        assert result == issues
+        sent = client.get_calls[-1].kwargs["headers"]
+        assert sent["If-None-Match"] == 'W/"abc"'
+        assert sent["Authorization"] == "Bearer ghp_test"
+
+    async def test_no_etag_no_conditional_header(self):
+        """Responses without an ETag are not cached."""
+        client = _FakeAsyncClient(get=_mock_response(200, []))
+
+        await fetch_issues("owner/repo", token="ghp_test", http=client)
+        await fetch_issues("owner/repo", token="ghp_test", http=client)
+
+        assert "If-None-Match" not in client.get_calls[-1].kwargs["headers"]
+
+    async def test_file_content_served_from_cache_on_304(self):
+        """get_file_content decodes the cached body on 304 Not Modified."""
+        first = httpx.Response(200, text="cached file", headers={"ETag": '"v1"'})
+        client = _FakeAsyncClient(get=[first, httpx.Response(304)])
+
+        await get_file_content("owner/repo", "a.txt", token="ghp_test", http=client)
+        result = await get_file_content("owner/repo", "a.txt", token="ghp_test", http=client)
+
+        assert result == "cached file"
+
+    async def test_cache_keyed_by_query(self):
+        """Different labels do not share an ETag entry."""
+        first = httpx.Response(200, json=[], headers={"ETag": '"x"'})
+        client = _FakeAsyncClient(get=first)
+
+        await fetch_issues("owner/repo", label="a", token="ghp_test", http=client)
+        await fetch_issues("owner/repo", label="b", token="ghp_test", http=client)
+
+        assert "If-None-Match" not in client.get_calls[-1].kwargs["headers"]
+
+    async def test_cache_keyed_by_token(self):
+        """A body cached under one token is not revalidated under another."""
+        first = httpx.Response(200, json=[], headers={"ETag": '"x"'})
+        client = _FakeAsyncClient(get=first)
+
+        await fetch_issues("owner/repo", token="ghp_one", http=client)
+        await fetch_issues("owner/repo", token="ghp_two", http=client)
+
+        assert "If-None-Match" not in client.get_calls[-1].kwargs["headers"]
+
+    async def test_cache_keyed_by_client_default_token(self):
+        """Without a per-call token, the client's default Authorization is the identity."""
+        first = httpx.Response(200, json=[], headers={"ETag": '"x"'})
+        client = _FakeAsyncClient(get=first)
+
+        client.headers = httpx.Headers({"Authorization": "Bearer ghp_one"})
+        await fetch_issues("owner/repo", http=client)
+        client.headers = httpx.Headers({"Authorization": "Bearer ghp_two"})
+        await fetch_issues("owner/repo", http=client)
+
+        assert client.get_calls[-1].kwargs["headers"] is None
+
+
 # ======================================================================
 # comment_on_issue
 # ======================================================================
@@ -200,61 +428,32 @@ class TestFetchIssues:
 class TestCommentOnIssue:
     """Tests for comment_on_issue."""
 
-    @pytest.mark.asyncio
     async def test_success_returns_true(self):
         """A 201 response returns True."""
         resp = _mock_response(201)
-        constructor, client = _mock_async_client(post=resp)
+        client = _FakeAsyncClient(post=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await comment_on_issue("owner/repo", 42, "Nice!", token="ghp_test")
+        result = await comment_on_issue("owner/repo", 42, "Nice!", token="ghp_test", http=client)
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_non_201_returns_false(self):
         """A non-201 status returns False."""
         resp = _mock_response(403)
-        constructor, client = _mock_async_client(post=resp)
+        client = _FakeAsyncClient(post=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await comment_on_issue("owner/repo", 42, "Test", token="ghp_test")
+        result = await comment_on_issue("owner/repo", 42, "Test", token="ghp_test", http=client)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    async def test_http_error_returns_false(self):
-        """An HTTP error returns False."""
-        constructor, client = _mock_async_client(
-            post=httpx.ConnectError("Connection refused")
-        )
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await comment_on_issue("owner/repo", 42, "Test", token="ghp_test")
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_unexpected_error_returns_false(self):
-        """An unexpected exception returns False."""
-        constructor, client = _mock_async_client(post=RuntimeError("boom"))
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await comment_on_issue("owner/repo", 42, "Test", token="ghp_test")
-
-        assert result is False
-
-    @pytest.mark.asyncio
     async def test_sends_correct_payload(self):
         """The comment body is sent as JSON payload."""
         resp = _mock_response(201)
-        constructor, client = _mock_async_client(post=resp)
+        client = _FakeAsyncClient(post=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            await comment_on_issue("owner/repo", 7, "Hello world", token="ghp_test")
+        await comment_on_issue("owner/repo", 7, "Hello world", token="ghp_test", http=client)
 
-        call_kwargs = client.post.call_args
-        json_payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        json_payload = client.post_calls[-1].kwargs["json"]
         assert json_payload == {"body": "Hello world"}
 
 
@@ -266,61 +465,32 @@ class TestCommentOnIssue:
 class TestCloseIssue:
     """Tests for close_issue."""
 
-    @pytest.mark.asyncio
     async def test_success_returns_true(self):
         """A 200 response returns True."""
         resp = _mock_response(200)
-        constructor, client = _mock_async_client(patch=resp)
+        client = _FakeAsyncClient(patch=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await close_issue("owner/repo", 42, token="ghp_test")
+        result = await close_issue("owner/repo", 42, token="ghp_test", http=client)
 
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_non_200_returns_false(self):
         """A non-200 status returns False."""
         resp = _mock_response(404)
-        constructor, client = _mock_async_client(patch=resp)
+        client = _FakeAsyncClient(patch=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await close_issue("owner/repo", 42, token="ghp_test")
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_http_error_returns_false(self):
-        """An HTTP error returns False."""
-        constructor, client = _mock_async_client(
-            patch=httpx.ConnectError("fail")
-        )
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await close_issue("owner/repo", 42, token="ghp_test")
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_unexpected_error_returns_false(self):
-        """An unexpected exception returns False."""
-        constructor, client = _mock_async_client(patch=RuntimeError("boom"))
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await close_issue("owner/repo", 42, token="ghp_test")
+        result = await close_issue("owner/repo", 42, token="ghp_test", http=client)
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_sends_closed_state(self):
         """The PATCH request sends state=closed."""
         resp = _mock_response(200)
-        constructor, client = _mock_async_client(patch=resp)
+        client = _FakeAsyncClient(patch=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            await close_issue("owner/repo", 7, token="ghp_test")
+        await close_issue("owner/repo", 7, token="ghp_test", http=client)
 
-        call_kwargs = client.patch.call_args
-        json_payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        json_payload = client.patch_calls[-1].kwargs["json"]
         assert json_payload == {"state": "closed"}
 
 
@@ -332,79 +502,84 @@ class TestCloseIssue:
 class TestGetFileContent:
     """Tests for get_file_content."""
 
-    @pytest.mark.asyncio
-    async def test_success_decodes_base64(self):
-        """A 200 response with base64 content is decoded correctly."""
+    async def test_success_returns_raw_body(self):
+        """A 200 response body is returned as-is via the raw media type."""
         content = "Hello, world!"
-        encoded = base64.b64encode(content.encode()).decode()
-        resp = _mock_response(200, {"content": encoded})
-        constructor, client = _mock_async_client(get=resp)
+        resp = httpx.Response(200, text=content)
+        client = _FakeAsyncClient(get=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content("owner/repo", "README.md", token="ghp_test")
+        result = await get_file_content("owner/repo", "README.md", token="ghp_test", http=client)
 
         assert result == content
+        sent = client.get_calls[-1].kwargs["headers"]
+        assert sent["Accept"] == "application/vnd.github.raw"
+        assert sent["Authorization"] == "Bearer ghp_test"
 
-    @pytest.mark.asyncio
     async def test_multiline_content(self):
-        """Multi-line base64 content is decoded properly."""
+        """Multi-line content is returned intact."""
         content = "line1\nline2\nline3"
-        encoded = base64.b64encode(content.encode()).decode()
-        resp = _mock_response(200, {"content": encoded})
-        constructor, client = _mock_async_client(get=resp)
+        resp = httpx.Response(200, text=content)
+        client = _FakeAsyncClient(get=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content("owner/repo", "file.txt", token="ghp_test")
+        result = await get_file_content("owner/repo", "file.txt", token="ghp_test", http=client)
 
         assert result == content
 
-    @pytest.mark.asyncio
     async def test_file_not_found_returns_none(self):
         """A 404 response returns None."""
         resp = _mock_response(404)
-        constructor, client = _mock_async_client(get=resp)
+        client = _FakeAsyncClient(get=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content("owner/repo", "nope.txt", token="ghp_test")
+        result = await get_file_content("owner/repo", "nope.txt", token="ghp_test", http=client)
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_http_error_returns_none(self):
-        """An HTTP error returns None."""
-        constructor, client = _mock_async_client(
-            get=httpx.ConnectError("fail")
-        )
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content("owner/repo", "file.txt", token="ghp_test")
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_unexpected_error_returns_none(self):
-        """An unexpected exception returns None."""
-        constructor, client = _mock_async_client(get=RuntimeError("boom"))
-
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content("owner/repo", "file.txt", token="ghp_test")
-
-        assert result is None
-
-    @pytest.mark.asyncio
     async def test_custom_branch(self):
         """Custom branch is passed as ref parameter."""
         content = "dev content"
-        encoded = base64.b64encode(content.encode()).decode()
-        resp = _mock_response(200, {"content": encoded})
-        constructor, client = _mock_async_client(get=resp)
+        resp = httpx.Response(200, text=content)
+        client = _FakeAsyncClient(get=resp)
 
-        with patch("scripts.utils.github_utils.httpx.AsyncClient", constructor):
-            result = await get_file_content(
-                "owner/repo", "file.txt", branch="dev", token="ghp_test"
-            )
+        result = await get_file_content(
+            "owner/repo", "file.txt", branch="dev", token="ghp_test", http=client
+        )
 
         assert result == content
-        call_kwargs = client.get.call_args
-        params = call_kwargs.kwargs.get("params") or call_kwargs[1].get("params")
+        params = client.get_calls[-1].kwargs["params"]
         assert params["ref"] == "dev"
+
+
+# ======================================================================
+# Error handling shared by the REST helpers
+# ======================================================================
+
+
+class TestRequestErrors:
+    """Transport and unexpected errors map to each helper's falsy result."""
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            httpx.ConnectError("Connection refused"),
+            httpx.ReadTimeout("timed out"),
+            RuntimeError("boom"),
+        ],
+        ids=["http_error", "timeout", "unexpected_error"],
+    )
+    @pytest.mark.parametrize(
+        "method, func, args, expected",
+        [
+            ("get", fetch_issues, ("owner/repo",), []),
+            ("post", comment_on_issue, ("owner/repo", 42, "Test"), False),
+            ("patch", close_issue, ("owner/repo", 42), False),
+            ("get", get_file_content, ("owner/repo", "file.txt"), None),
+        ],
+        ids=["fetch_issues", "comment_on_issue", "close_issue", "get_file_content"],
+    )
+    async def test_error_returns_falsy(self, method, func, args, expected, exc):
+        client = _FakeAsyncClient(**{method: exc})
+
+        result = await func(*args, token="ghp_test", http=client)
+
+        assert result == expected
+        assert type(result) is type(expected)
@@ -0,0 +1,65 @@
+"""Tests for the on-disk ETag cache (scripts/utils/http_cache.py)."""
+
+import pytest
+
+from scripts.utils import http_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    """Point the cache at a per-test directory."""
+    path = tmp_path / "http_cache"
+    monkeypatch.setattr(http_cache, "_CACHE_DIR", path)
+    return path
+
+
+class TestHttpCache:
+    def test_miss_returns_none(self):
+        assert http_cache.get("https://api.github.com/x") is None
+
+    def test_put_then_get_roundtrip(self):
+        http_cache.put("https://api.github.com/x", '"etag"', '{"a": 1}')
+        assert http_cache.get("https://api.github.com/x") == ('"etag"', '{"a": 1}')
+
+    def test_put_overwrites(self):
+        http_cache.put("https://api.github.com/x", '"v1"', "old")
+        http_cache.put("https://api.github.com/x", '"v2"', "new")
+        assert http_cache.get("https://api.github.com/x") == ('"v2"', "new")
+
+    def test_urls_are_independent(self):
+        http_cache.put("https://api.github.com/x?a=1", '"a"', "A")
+        assert http_cache.get("https://api.github.com/x?a=2") is None
+
+    def test_corrupt_entry_is_a_miss(self, cache_dir):
+        http_cache.put("https://api.github.com/x", '"e"', "body")
+        next(cache_dir.iterdir()).write_text("{not json")
+        assert http_cache.get("https://api.github.com/x") is None
+
+
+class TestCacheKey:
+    def test_accept_header_is_part_of_key(self):
+        url = "https://api.github.com/x"
+        assert http_cache.cache_key(url, {"Accept": "a"}) != http_cache.cache_key(
+            url, {"Accept": "b"}
+        )
+
+    def test_header_names_are_case_insensitive(self):
+        url = "https://api.github.com/x"
+        assert http_cache.cache_key(url, {"Accept": "a"}) == http_cache.cache_key(
+            url, {"accept": "a"}
+        )
+
+    def test_token_is_hashed_not_stored(self, cache_dir):
+        key = http_cache.cache_key(
+            "https://api.github.com/x", {"Authorization": "Bearer ghp_secret"}
+        )
+        http_cache.put(key, '"e"', "body")
+
+        assert "ghp_secret" not in key
+        assert "ghp_secret" not in next(cache_dir.iterdir()).read_text()
+
+    def test_tokens_do_not_share_entries(self):
+        url = "https://api.github.com/x"
+        http_cache.put(http_cache.cache_key(url, {"Authorization": "Bearer a"}), '"e"', "A")
+        assert http_cache.get(http_cache.cache_key(url, {"Authorization": "Bearer b"})) is None
+        assert http_cache.get(http_cache.cache_key(url)) is None
@@ -126,6 +126,61 @@ class TestRunStep:
         result = _run_step("async step", async_fn, is_async=True)
         assert result is True
 
+    def test_run_step_installs_eager_task_factory(self):
+        import asyncio
+
+        from main import _run_step
+
+        seen = {}
+
+        async def async_fn():
+            seen["factory"] = asyncio.get_running_loop().get_task_factory()
+
+        assert _run_step("async step", async_fn, is_async=True) is True
+        assert seen["factory"] is getattr(asyncio, "eager_task_factory", None)
+
+    def test_event_loop_runner_prefers_uvloop(self):
+        from types import SimpleNamespace
+
+        from main import _event_loop_runner
+
+        fake_uvloop = SimpleNamespace(run=object())
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}), \
+             patch("main.sys.platform", "linux"):
+            assert _event_loop_runner() is fake_uvloop.run
+
+    def test_event_loop_runner_falls_back_to_asyncio(self):
+        import asyncio
+
+        from main import _event_loop_runner
+
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert _event_loop_runner() is asyncio.run
+
+    def test_event_loop_runner_skips_uvloop_on_windows(self):
+        import asyncio
+        from types import SimpleNamespace
+
+        from main import _event_loop_runner
+
+        with patch.dict("sys.modules", {"uvloop": SimpleNamespace(run=object())}), \
+             patch("main.sys.platform", "win32"):
+            assert _event_loop_runner() is asyncio.run
+
+    def test_import_does_not_load_asyncio(self):
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print('asyncio' in sys.modules)"],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestPipelineExitCodes:
     """Tests for pipeline exit code behavior."""
@@ -15,8 +15,6 @@ import json
 from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from scripts.process_issues import (
     _build_job_listing,
     _get_missing_fields,
@@ -430,7 +428,6 @@ class TestGetMissingFields:
 class TestProcessIssues:
     """Tests for the process_issues async function."""
 
-    @pytest.mark.asyncio
     async def test_no_issues_returns_zero(self, tmp_path):
         """When there are no open issues, returns 0."""
         config_mock = type("Config", (), {
@@ -444,7 +441,6 @@ class TestProcessIssues:
             result = await process_issues()
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_no_token_returns_zero(self):
         """When GITHUB_TOKEN is not set, returns 0."""
         config_mock = type("Config", (), {
@@ -457,7 +453,6 @@ class TestProcessIssues:
             result = await process_issues()
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_valid_submission_accepted(self, tmp_path):
         """A valid submission is added to jobs.json and issue is closed."""
         jobs_path = tmp_path / "jobs.json"
@@ -496,7 +491,6 @@ class TestProcessIssues:
         assert len(saved["listings"]) == 1
         assert saved["listings"][0]["company"] == "Stripe"
 
-    @pytest.mark.asyncio
     async def test_missing_fields_rejected(self, tmp_path):
         """An issue with missing required fields is rejected."""
         body = "### Company Name\n\n\n\n### Role Title\n\nIntern\n\n### Application URL\n\nhttps://test.com\n\n### Location(s)\n\nNYC"
@@ -524,7 +518,6 @@ class TestProcessIssues:
         comment_body = mock_comment.call_args[0][2]
         assert "required fields" in comment_body.lower() or "template" in comment_body.lower()
 
-    @pytest.mark.asyncio
     async def test_invalid_url_rejected(self, tmp_path):
         """An issue with an invalid URL is rejected."""
         issue = _make_issue(number=12, url="not-a-url")
@@ -550,7 +543,6 @@ class TestProcessIssues:
         comment_body = mock_comment.call_args[0][2]
         assert "url" in comment_body.lower() or "URL" in comment_body
 
-    @pytest.mark.asyncio
     async def test_malformed_body_rejected(self, tmp_path):
         """An issue with a totally malformed body is rejected."""
         issue = _make_issue(number=13, body="random text no structure at all")
@@ -574,7 +566,6 @@ class TestProcessIssues:
 
         assert result == 0
 
-    @pytest.mark.asyncio
     async def test_multiple_issues_processed(self, tmp_path):
         """Multiple valid issues are all processed correctly."""
         jobs_path = tmp_path / "jobs.json"
@@ -615,7 +606,6 @@ class TestProcessIssues:
         saved = json.loads(jobs_path.read_text())
         assert len(saved["listings"]) == 2
 
-    @pytest.mark.asyncio
     async def test_error_isolated_per_issue(self, tmp_path):
         """An error on one issue does not prevent processing of others."""
         jobs_path = tmp_path / "jobs.json"
@@ -649,7 +639,6 @@ class TestProcessIssues:
         # The good issue should still be processed
         assert result >= 1
 
-    @pytest.mark.asyncio
     async def test_duplicate_listing_rejected(self, tmp_path):
         """A submission that duplicates an existing listing is rejected."""
         # Pre-populate jobs.json with a listing
@@ -700,7 +689,6 @@ class TestProcessIssues:
         comment_body = mock_comment.call_args[0][2]
         assert "already exist" in comment_body.lower()
 
-    @pytest.mark.asyncio
     async def test_mixed_valid_and_invalid(self, tmp_path):
         """Mix of valid and invalid issues; only valid ones are accepted."""
         jobs_path = tmp_path / "jobs.json"
@@ -734,7 +722,6 @@ class TestProcessIssues:
 
         assert result == 1
 
-    @pytest.mark.asyncio
     async def test_github_api_error_during_comment(self, tmp_path):
         """If commenting fails, the issue processing still continues."""
         jobs_path = tmp_path / "jobs.json"
@@ -766,7 +753,6 @@ class TestProcessIssues:
         # Listing should still be added even if comment fails
         assert result == 1
 
-    @pytest.mark.asyncio
     async def test_category_mapping_all_values(self):
         """All CATEGORY_MAP values map correctly."""
         assert _map_category("Software Engineering") == RoleCategory.SWE
@@ -776,7 +762,6 @@ class TestProcessIssues:
         assert _map_category("Hardware Engineering") == RoleCategory.HARDWARE
         assert _map_category("Other") == RoleCategory.OTHER
 
-    @pytest.mark.asyncio
     async def test_database_not_saved_when_no_accepted(self, tmp_path):
         """When no issues are accepted, the database is not saved."""
         jobs_path = tmp_path / "jobs.json"